@@ -5,13 +5,30 @@ from typing import Any, Dict, Optional, List, Union, TypeVar, Generic
 import asyncio
 import time
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from utils.logging_setup import get_logger, log_kv, instrument
 
 T = TypeVar('T')
 
+# Last formatted timestamp, keyed by whole second
+_timestamp_cache = {'second': None, 'value': ''}
+
+
+def iso_timestamp() -> str:
+    """Return the current local time as ISO-8601, formatted at most once per second."""
+    second = int(time.time())
+    if second != _timestamp_cache['second']:
+        _timestamp_cache['value'] = datetime.fromtimestamp(second).isoformat()
+        _timestamp_cache['second'] = second
+    return _timestamp_cache['value']
+
 class AgentResponse(BaseModel, Generic[T]):
-    """Standardized agent response model."""
+    """Standardized agent response model.
+
+    Responses are immutable once built and reject unknown fields.
+    """
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     success: bool
     result: Optional[T] = None
     errors: List[str] = Field(default_factory=list)
@@ -63,7 +80,7 @@ class BaseAgent(ABC):
         Returns:
             Dictionary with result and metadata
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         self.metrics['tasks_processed'] += 1
         
         try:
@@ -71,7 +88,7 @@ class BaseAgent(ABC):
             result = await self.process(data)
             
             self.metrics['tasks_successful'] += 1
-            processing_time = time.time() - start_time
+            processing_time = time.monotonic() - start_time
             self.metrics['total_processing_time'] += processing_time
             
             self.logger.info(f"{self.name} completed task in {processing_time:.2f}s")
@@ -81,12 +98,12 @@ class BaseAgent(ABC):
                 'agent': self.name,
                 'result': result,
                 'processing_time': processing_time,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': iso_timestamp()
             }
             
         except Exception as e:
             self.metrics['tasks_failed'] += 1
-            processing_time = time.time() - start_time
+            processing_time = time.monotonic() - start_time
             
             self.logger.error(f"{self.name} failed: {str(e)}")
             
@@ -95,7 +112,7 @@ class BaseAgent(ABC):
                 'agent': self.name,
                 'error': str(e),
                 'processing_time': processing_time,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': iso_timestamp()
             }
     
     def get_metrics(self) -> Dict[str, Any]:
@@ -113,6 +130,19 @@ class BaseAgent(ABC):
             'uptime': f"{runtime / 3600:.2f} hours"
         }
     
+    async def _send(self, message: Any) -> None:
+        """Send a message on the bus inline.
+
+        handle_message() runs process() and then sends the response, strictly
+        in sequence, so it is awaited directly by the message bus; don't wrap
+        it in asyncio.create_task, which only adds a Task allocation and an
+        extra event-loop iteration per message.
+
+        Args:
+            message: AgentMessage to send
+        """
+        await self.message_bus.send(message)
+
     async def health_check(self) -> bool:
         """Check if the agent is healthy and ready to process tasks."""
         return True
@@ -133,7 +163,7 @@ class BaseAgent(ABC):
         response = {
             'success': success,
             'agent': self.name,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': iso_timestamp()
         }
         
         if success:
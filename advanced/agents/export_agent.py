@@ -1,17 +1,66 @@
 """Export Agent - Saves applications locally as markdown files."""
 
+import asyncio
+import heapq
 import json
 import os
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 
+try:
+    import orjson
+    orjson_available = True
+except ImportError:
+    orjson_available = False
+
 from agents.base_agent import BaseAgent, AgentResponse
 from utils import get_logger, log_kv
 from core import AgentMessage, MessageType
 
 logger = get_logger("export_agent")
 
+# README sections; the per-export lists (top categories, key metrics)
+# are inserted between them
+README_HEADER = """# Application Summary
+
+## Job Details
+- **Company**: {company}
+- **Role**: {role}
+- **URL**: {url}
+- **Generated**: {generated_at:%Y-%m-%d %H:%M:%S}
+
+## Scoring Results
+- **Total Score**: {total_score}/100
+- **Recommendation**: {recommendation}
+
+## Top Scoring Categories
+"""
+
+README_POSITIONING = """
+## Positioning Strategy
+- **Strategy**: {strategy}
+- **Primary Angle**: {primary_angle}
+
+## Key Metrics Emphasized
+"""
+
+README_FOOTER = """
+## Files
+- `resume.md` - Tailored resume
+- `cover_letter.md` - Personalized cover letter
+- `job_description.txt` - Original job posting
+- `metadata.json` - Complete application data
+
+## Next Steps
+1. Review and finalize the resume and cover letter
+2. Submit application through company portal
+3. Track application status
+"""
+
+# Drops characters that are invalid in filenames and turns spaces into underscores
+FILENAME_TRANSLATION = str.maketrans({**{char: None for char in '<>:"/\\|?*'}, ' ': '_'})
+
 
 class ExportAgent(BaseAgent):
     """Saves generated applications to local filesystem."""
@@ -28,13 +77,14 @@ class ExportAgent(BaseAgent):
         self.base_dir = Path(config.get('export_dir', 'data/applications'))
         self.base_dir.mkdir(parents=True, exist_ok=True)
 
-        logger.info(f"ExportAgent initialized with base directory: {self.base_dir}")
+        logger.info("ExportAgent initialized with base directory: %s", self.base_dir)
 
     async def process(self, data: Any) -> AgentResponse:
         """Process export request.
 
         Args:
-            data: Input containing content, job data, and metadata
+            data: Input containing content, job data, and metadata;
+                set write_readme to False to skip README.md
 
         Returns:
             Export response with file paths
@@ -46,15 +96,17 @@ class ExportAgent(BaseAgent):
             scoring_result = data.get('scoring_result', {})
             positioning_strategy = data.get('positioning_strategy', {})
 
+            # One clock read per export; every timestamp below derives from it
+            now = datetime.now()
+            timestamp = now.strftime('%Y-%m-%d_%H%M%S')
+
             # Create folder name
-            timestamp = datetime.now().strftime('%Y-%m-%d_%H%M%S')
             company = self._sanitize_filename(job_data.get('company', 'Unknown'))
             role = self._sanitize_filename(job_data.get('role', 'PM'))
             folder_name = f"{timestamp}_{company}_{role}"
 
-            # Create application folder
+            # Application folder (created with the files, off the event loop)
             app_dir = self.base_dir / folder_name
-            app_dir.mkdir(parents=True, exist_ok=True)
 
             # Log export request
             log_kv(logger, "export_request",
@@ -63,19 +115,19 @@ class ExportAgent(BaseAgent):
                 folder=folder_name,
                 score=scoring_result.get('total_score', 0))
 
-            # Save resume
+            # Build every file in memory first, then write them in one batch
             resume_path = app_dir / "resume.md"
-            with open(resume_path, 'w') as f:
-                f.write(content_result.get('resume', ''))
-            logger.info(f"Saved resume to {resume_path}")
-
-            # Save cover letter
             cover_path = app_dir / "cover_letter.md"
-            with open(cover_path, 'w') as f:
-                f.write(content_result.get('cover_letter', ''))
-            logger.info(f"Saved cover letter to {cover_path}")
+            metadata_path = app_dir / "metadata.json"
+            readme_path = app_dir / "README.md"
+
+            # Payloads are encoded to UTF-8 once, here, and written as-is
+            files = [
+                ("resume", resume_path, content_result.get('resume', '').encode('utf-8')),
+                ("cover letter", cover_path, content_result.get('cover_letter', '').encode('utf-8'))
+            ]
 
-            # Save metadata
+            # Metadata
             metadata = {
                 'job_data': job_data,
                 'scoring': {
@@ -88,27 +140,26 @@ class ExportAgent(BaseAgent):
                     'voice_blend': content_result.get('voice_blend', {}),
                     'hook': positioning_strategy.get('hook', '')
                 },
-                'generated_at': datetime.now().isoformat(),
+                'generated_at': now.isoformat(),
                 'export_timestamp': timestamp
             }
 
-            metadata_path = app_dir / "metadata.json"
-            with open(metadata_path, 'w') as f:
-                json.dump(metadata, f, indent=2)
-            logger.info(f"Saved metadata to {metadata_path}")
+            files.append(("metadata", metadata_path, self._serialize_metadata(metadata)))
 
-            # Save job description if available
+            # Job description if available
             if job_data.get('description'):
-                jd_path = app_dir / "job_description.txt"
-                with open(jd_path, 'w') as f:
-                    f.write(job_data['description'])
-                logger.info(f"Saved job description to {jd_path}")
+                files.append(("job description", app_dir / "job_description.txt",
+                              job_data['description'].encode('utf-8')))
 
-            # Create README with summary
-            readme_content = self._create_readme(job_data, scoring_result, positioning_strategy)
-            readme_path = app_dir / "README.md"
-            with open(readme_path, 'w') as f:
-                f.write(readme_content)
+            # README with summary, unless the caller opted out
+            write_readme = data.get('write_readme', True)
+            if write_readme:
+                readme_content = self._create_readme(job_data, scoring_result, positioning_strategy, now)
+                files.append(("README", readme_path, readme_content.encode('utf-8')))
+
+            # Blocking filesystem work runs in a worker thread so concurrent
+            # exports and other agents keep the event loop
+            folder_size_kb = await asyncio.to_thread(self._write_export, app_dir, files)
 
             # Build export result
             export_result = {
@@ -116,13 +167,15 @@ class ExportAgent(BaseAgent):
                 'paths': {
                     'resume': str(resume_path),
                     'cover_letter': str(cover_path),
-                    'metadata': str(metadata_path),
-                    'readme': str(readme_path)
+                    'metadata': str(metadata_path)
                 },
                 'status': 'success',
                 'message': f'Application saved to {app_dir}'
             }
 
+            if write_readme:
+                export_result['paths']['readme'] = str(readme_path)
+
             # Log success
             log_kv(logger, "export_complete",
                 folder=folder_name,
@@ -133,86 +186,101 @@ class ExportAgent(BaseAgent):
                 result=export_result,
                 metrics={
                     'files_created': len(export_result['paths']),
-                    'folder_size_kb': self._get_folder_size(app_dir)
+                    'folder_size_kb': folder_size_kb
                 }
             )
 
         except Exception as e:
-            logger.error(f"Export failed: {e}")
+            logger.error("Export failed: %s", e)
             return AgentResponse(
                 success=False,
                 errors=[str(e)]
             )
 
-    def _sanitize_filename(self, name: str) -> str:
-        """Sanitize string for use in filename."""
-        # Remove invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            name = name.replace(char, '')
+    def _serialize_metadata(self, metadata: Dict[str, Any]) -> bytes:
+        """Serialize export metadata as indented UTF-8 JSON."""
+        if orjson_available:
+            return orjson.dumps(metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        return json.dumps(metadata, indent=2).encode('utf-8')
 
-        # Replace spaces with underscores
-        name = name.replace(' ', '_')
+    def _write_export(self, app_dir: Path, files: List[Tuple[str, Path, bytes]]) -> float:
+        """Create the application folder, write its files and measure it.
 
-        # Limit length
-        return name[:50]
+        Args:
+            app_dir: Application folder
+            files: (label, path, content) for each file, in write order
+
+        Returns:
+            Folder size in KB
+        """
+        app_dir.mkdir(parents=True, exist_ok=True)
+        self._write_files(files)
+        return self._get_folder_size(app_dir)
+
+    def _write_files(self, files: List[Tuple[str, Path, bytes]]) -> None:
+        """Write a batch of prepared files.
+
+        Args:
+            files: (label, path, encoded content) for each file, in write order
+        """
+        for label, path, content in files:
+            self._write_once(path, content)
+            logger.info("Saved %s to %s", label, path)
+
+    def _write_once(self, path: Path, data: bytes) -> None:
+        """Write a file with raw os calls: open, write the payload, close.
+
+        Skips the FileIO object open() would build; the loop only repeats
+        on a short write.
+        """
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
+    def _sanitize_filename(self, name: str) -> str:
+        """Sanitize string for use in filename."""
+        # Remove invalid characters and replace spaces in one pass, then limit length
+        return name.translate(FILENAME_TRANSLATION)[:50]
 
     def _create_readme(self,
                        job_data: Dict[str, Any],
                        scoring_result: Dict[str, Any],
-                       positioning_strategy: Dict[str, Any]) -> str:
+                       positioning_strategy: Dict[str, Any],
+                       generated_at: datetime) -> str:
         """Create README with application summary."""
-        readme = f"""# Application Summary
-
-## Job Details
-- **Company**: {job_data.get('company', 'Unknown')}
-- **Role**: {job_data.get('role', 'Unknown')}
-- **URL**: {job_data.get('url', 'N/A')}
-- **Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-## Scoring Results
-- **Total Score**: {scoring_result.get('total_score', 0)}/100
-- **Recommendation**: {scoring_result.get('recommendation', 'N/A')}
-
-## Top Scoring Categories
-"""
+        parts = [README_HEADER.format(
+            company=job_data.get('company', 'Unknown'),
+            role=job_data.get('role', 'Unknown'),
+            url=job_data.get('url', 'N/A'),
+            generated_at=generated_at,
+            total_score=scoring_result.get('total_score', 0),
+            recommendation=scoring_result.get('recommendation', 'N/A')
+        )]
         # Add top categories
         breakdown = scoring_result.get('category_breakdown', {})
         if breakdown:
-            sorted_categories = sorted(breakdown.items(), key=lambda x: x[1], reverse=True)
-            for category, score in sorted_categories[:3]:
-                readme += f"- {category}: {score:.1f}\n"
-
-        readme += f"""
-## Positioning Strategy
-- **Strategy**: {positioning_strategy.get('strategy_name', 'N/A')}
-- **Primary Angle**: {positioning_strategy.get('primary_angle', 'N/A')}
+            top_categories = heapq.nlargest(3, breakdown.items(), key=lambda x: x[1])
+            parts.extend(f"- {category}: {score:.1f}\n" for category, score in top_categories)
 
-## Key Metrics Emphasized
-"""
-        for metric in positioning_strategy.get('key_metrics', [])[:5]:
-            readme += f"- {metric}\n"
-
-        readme += """
-## Files
-- `resume.md` - Tailored resume
-- `cover_letter.md` - Personalized cover letter
-- `job_description.txt` - Original job posting
-- `metadata.json` - Complete application data
+        parts.append(README_POSITIONING.format(
+            strategy=positioning_strategy.get('strategy_name', 'N/A'),
+            primary_angle=positioning_strategy.get('primary_angle', 'N/A')
+        ))
+        parts.extend(f"- {metric}\n" for metric in positioning_strategy.get('key_metrics', [])[:5])
 
-## Next Steps
-1. Review and finalize the resume and cover letter
-2. Submit application through company portal
-3. Track application status
-"""
-        return readme
+        parts.append(README_FOOTER)
+        return "".join(parts)
 
     def _get_folder_size(self, folder: Path) -> float:
         """Get total size of folder in KB."""
-        total_size = 0
-        for file in folder.glob('*'):
-            if file.is_file():
-                total_size += file.stat().st_size
+        # scandir reuses the directory listing's entry type, so only the
+        # size lookup costs a stat() per file
+        with os.scandir(folder) as entries:
+            total_size = sum(entry.stat().st_size for entry in entries if entry.is_file())
         return round(total_size / 1024, 2)
 
     async def handle_message(self, message: AgentMessage) -> None:
@@ -230,8 +298,8 @@ class ExportAgent(BaseAgent):
                 sender=self.name,
                 recipient=message.sender,
                 message_type=MessageType.EXPORT_COMPLETE,
-                data=result.dict(),
+                data=result.model_dump(),
                 correlation_id=message.correlation_id
             )
 
-            await self.message_bus.send(response)
\ No newline at end of file
+            await self._send(response)
\ No newline at end of file
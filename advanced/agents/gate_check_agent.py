@@ -2,21 +2,58 @@
 Gate Check Agent - Validates hard requirements before application generation.
 """
 
+import asyncio
+import copy
+import hashlib
+import json
 import re
-from typing import Dict, Any, List, Tuple
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Pattern, Set, Tuple
+
+try:
+    import hyperscan
+    hyperscan_available = True
+except ImportError:
+    hyperscan_available = False
+
 from utils import get_logger
 from .base_agent import BaseAgent, AgentResponse
 
 logger = get_logger("gate_check_agent")
 
+# Order checks run in (and appear in results); fast-fail mode runs the
+# cheapest, most decisive checks first and stops at the first failure
+CHECK_ORDER = ('education', 'location', 'work_authorization', 'experience')
+FAST_FAIL_CHECK_ORDER = ('work_authorization', 'experience', 'location', 'education')
+
+# Education fields considered quantitative, matched anywhere in the field name
+QUANTITATIVE_FIELD_RE = re.compile(
+    'statistics|economics|mathematics|computer science|engineering|physics|'
+    'operations research|analytics|information systems|finance|accounting|data science',
+    re.IGNORECASE
+)
+
+
+def _compile_patterns(patterns: List[str]) -> List[Pattern]:
+    """Compile patterns case-insensitively, keeping them separate (for ordered matching)."""
+    return [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+
+
+def _compile_any(patterns: List[str]) -> Pattern:
+    """Fuse patterns into one case-insensitive alternation that matches if any of them does."""
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns), re.IGNORECASE)
+
+
 class GateCheckAgent(BaseAgent):
     """Agent that performs gate checks on job requirements vs candidate profile."""
 
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__("GateCheckAgent", config or {})
 
-        # Load hard requirement patterns
-        self.education_patterns = {
+        # Load hard requirement patterns (compiled once, matched case-insensitively).
+        # Yes/no checks fuse their patterns so the JD is scanned once per category.
+        self.education_patterns = {name: _compile_any(patterns) for name, patterns in {
             'quantitative_bachelor': [
                 r'bachelor.{0,100}degree.{0,50}in.{0,10}(a )?quantitative.{0,20}field',
                 r'bachelor.{0,100}(statistics|economics|operations research|analytics|mathematics|computer science|computer engineering|software engineering|mechanical engineering|information systems)',
@@ -38,36 +75,66 @@ class GateCheckAgent(BaseAgent):
                 r'bachelor.{0,10}degree',
                 r'education.{0,50}requirement'
             ]
-        }
+        }.items()}
 
         self.location_patterns = {
-            'no_remote': [
+            'no_remote': _compile_any([
                 r'no remote',
                 r'onsite only',
                 r'in.office',
                 r'must be located in',
                 r'local candidates only'
-            ],
-            'specific_location': [
+            ]),
+            'specific_location': _compile_patterns([
                 r'must be in (.*?)[,\.]',
                 r'located in (.*?)[,\.]',
                 r'based in (.*?)[,\.]'
-            ]
+            ])
         }
 
-        self.authorization_patterns = [
+        self.authorization_patterns = _compile_any([
             r'no sponsorship',
             r'must be authorized to work',
             r'us citizen',
             r'green card',
             r'permanent resident'
-        ]
+        ])
 
-        self.experience_patterns = [
-            r'(\d+)\+?\s*years?.{0,50}(product management|pm|product manager)',
-            r'minimum.{0,20}(\d+).{0,20}years',
+        # Years-of-experience phrasings, most specific first. Each is searched
+        # separately so one phrasing can't consume text another would match
+        self.experience_patterns = _compile_patterns([
+            r'(\d+)\+?\s*years?.{0,50}(?:product management|pm|product manager)',
+            r'minimum.{0,20}(?<!\d)(\d+).{0,20}years',
             r'(\d+).{0,20}years.{0,20}experience'
-        ]
+        ])
+
+        # Yes/no categories, scanned together in one pass when hyperscan is installed
+        self.category_patterns = {
+            'hard_requirement_indicators': self.education_patterns['hard_requirement_indicators'],
+            'quantitative_bachelor': self.education_patterns['quantitative_bachelor'],
+            'any_masters': self.education_patterns['any_masters'],
+            'no_remote': self.location_patterns['no_remote'],
+            'work_authorization': self.authorization_patterns
+        }
+        self._scan_db = self._build_scan_db() if self.config.get('use_hyperscan', True) else None
+        # A hyperscan database shares one scratch space, so scans are serialized
+        self._scan_lock = threading.Lock()
+
+        # Long JDs are checked in a worker thread so regex scanning doesn't
+        # stall the event loop; short ones are faster to check inline
+        self.offload_min_chars = self.config.get('offload_min_chars', 5000)
+
+        self._checks = {
+            'education': self._check_education_requirements,
+            'location': self._check_location_requirements,
+            'work_authorization': self._check_work_authorization,
+            'experience': self._check_experience_requirements
+        }
+
+        # Results keyed by JD + profile digest; the same posting is often
+        # checked again for related roles at a company
+        self.result_cache_size = self.config.get('result_cache_size', 256)
+        self._result_cache: "OrderedDict[Tuple[bytes, bytes, bool], Dict[str, Any]]" = OrderedDict()
 
     async def process(self, data: Dict[str, Any]) -> AgentResponse:
         """Perform gate checks on job requirements."""
@@ -75,66 +142,35 @@ class GateCheckAgent(BaseAgent):
             job_data = data['job_data']
             candidate_profile = data.get('candidate_profile', {})
 
-            logger.info(f"Gate check started for {job_data.get('company')} - {job_data.get('role')}")
-
-            # Extract requirements from JD
-            jd_text = job_data.get('description', '').lower()
-
-            gate_results = {
-                'overall_status': 'PASS',
-                'critical_failures': [],
-                'warnings': [],
-                'requirements_analysis': {},
-                'recommendation': 'PROCEED'
-            }
-
-            # Check education requirements
-            education_check = self._check_education_requirements(jd_text, candidate_profile)
-            gate_results['requirements_analysis']['education'] = education_check
-
-            if education_check['status'] == 'FAIL':
-                gate_results['critical_failures'].append(education_check['message'])
-                gate_results['overall_status'] = 'FAIL'
-            elif education_check['status'] == 'WARNING':
-                gate_results['warnings'].append(education_check['message'])
-
-            # Check location requirements
-            location_check = self._check_location_requirements(jd_text, candidate_profile)
-            gate_results['requirements_analysis']['location'] = location_check
-
-            if location_check['status'] == 'FAIL':
-                gate_results['critical_failures'].append(location_check['message'])
-                gate_results['overall_status'] = 'FAIL'
-            elif location_check['status'] == 'WARNING':
-                gate_results['warnings'].append(location_check['message'])
-
-            # Check work authorization
-            auth_check = self._check_work_authorization(jd_text, candidate_profile)
-            gate_results['requirements_analysis']['work_authorization'] = auth_check
+            logger.info("Gate check started for %s - %s", job_data.get('company'), job_data.get('role'))
 
-            if auth_check['status'] == 'FAIL':
-                gate_results['critical_failures'].append(auth_check['message'])
-                gate_results['overall_status'] = 'FAIL'
+            # Extract requirements from JD (patterns ignore case, so no lowercased copy)
+            jd_text = job_data.get('description', '')
 
-            # Check experience requirements
-            experience_check = self._check_experience_requirements(jd_text, candidate_profile)
-            gate_results['requirements_analysis']['experience'] = experience_check
+            fast_fail = data.get('fast_fail', False)
+            key = self._cache_key(jd_text, candidate_profile, fast_fail)
+            cached = self._result_cache.get(key)
 
-            if experience_check['status'] == 'FAIL':
-                gate_results['critical_failures'].append(experience_check['message'])
-                gate_results['overall_status'] = 'FAIL'
-            elif experience_check['status'] == 'WARNING':
-                gate_results['warnings'].append(experience_check['message'])
-
-            # Determine final recommendation
-            if gate_results['overall_status'] == 'FAIL':
-                gate_results['recommendation'] = 'DO_NOT_SUBMIT'
-            elif len(gate_results['warnings']) > 2:
-                gate_results['recommendation'] = 'SUBMIT_WITH_CAUTION'
+            if cached is not None:
+                self._result_cache.move_to_end(key)
+                gate_results = copy.deepcopy(cached)
+                logger.info("Gate check result served from cache")
             else:
-                gate_results['recommendation'] = 'PROCEED'
-
-            logger.info(f"Gate check completed: {gate_results['overall_status']} - {len(gate_results['critical_failures'])} failures, {len(gate_results['warnings'])} warnings")
+                if len(jd_text) >= self.offload_min_chars:
+                    gate_results = await asyncio.to_thread(
+                        self._run_checks, jd_text, candidate_profile, fast_fail
+                    )
+                else:
+                    gate_results = self._run_checks(jd_text, candidate_profile, fast_fail)
+                if self.result_cache_size > 0:
+                    self._result_cache[key] = copy.deepcopy(gate_results)
+                    while len(self._result_cache) > self.result_cache_size:
+                        self._result_cache.popitem(last=False)
+
+            logger.info("Gate check completed: %s - %d failures, %d warnings",
+                        gate_results['overall_status'],
+                        len(gate_results['critical_failures']),
+                        len(gate_results['warnings']))
 
             return AgentResponse(
                 success=True,
@@ -147,21 +183,126 @@ class GateCheckAgent(BaseAgent):
             )
 
         except Exception as e:
-            logger.error(f"Gate check failed: {str(e)}")
+            logger.error("Gate check failed: %s", e)
             return AgentResponse(
                 success=False,
                 result={},
                 errors=[f"Gate check failed: {str(e)}"]
             )
 
-    def _check_education_requirements(self, jd_text: str, profile: Dict) -> Dict[str, Any]:
+    def _cache_key(self, jd_text: str, profile: Dict, fast_fail: bool) -> Tuple[bytes, bytes, bool]:
+        """Build the result cache key from JD and profile digests."""
+        jd_digest = hashlib.blake2b(jd_text.encode('utf-8'), digest_size=16).digest()
+        profile_digest = hashlib.blake2b(
+            json.dumps(profile, sort_keys=True, default=str).encode('utf-8'), digest_size=16
+        ).digest()
+        return jd_digest, profile_digest, fast_fail
+
+    def _run_checks(self, jd_text: str, profile: Dict, fast_fail: bool) -> Dict[str, Any]:
+        """Run the gate checks and build the results.
+
+        Args:
+            jd_text: Job description text
+            profile: Candidate profile
+            fast_fail: Stop at the first failing check
+
+        Returns:
+            Gate results with status, failures, warnings and recommendation
+        """
+        gate_results = {
+            'overall_status': 'PASS',
+            'critical_failures': [],
+            'warnings': [],
+            'requirements_analysis': {},
+            'recommendation': 'PROCEED'
+        }
+
+        # Match every yes/no category in a single scan when possible
+        hits = self._scan_categories(jd_text)
+
+        # Once a check fails the recommendation can't change, so fast-fail
+        # callers skip the remaining checks
+        check_order = FAST_FAIL_CHECK_ORDER if fast_fail else CHECK_ORDER
+
+        for check_name in check_order:
+            check = self._checks[check_name](jd_text, profile, hits)
+            gate_results['requirements_analysis'][check_name] = check
+
+            if check['status'] == 'FAIL':
+                gate_results['critical_failures'].append(check['message'])
+                gate_results['overall_status'] = 'FAIL'
+                if fast_fail:
+                    break
+            elif check['status'] == 'WARNING':
+                gate_results['warnings'].append(check['message'])
+
+        # Determine final recommendation
+        if gate_results['overall_status'] == 'FAIL':
+            gate_results['recommendation'] = 'DO_NOT_SUBMIT'
+        elif len(gate_results['warnings']) > 2:
+            gate_results['recommendation'] = 'SUBMIT_WITH_CAUTION'
+        else:
+            gate_results['recommendation'] = 'PROCEED'
+
+        return gate_results
+
+    def _build_scan_db(self) -> Optional[Any]:
+        """Compile all yes/no categories into one hyperscan database.
+
+        Returns:
+            Hyperscan database, or None to use the compiled regexes instead
+        """
+        if not hyperscan_available:
+            return None
+
+        flags = (hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH |
+                 hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP)
+        patterns = list(self.category_patterns.values())
+
+        try:
+            db = hyperscan.Database()
+            db.compile(
+                expressions=[pattern.pattern.encode('utf-8') for pattern in patterns],
+                ids=list(range(len(patterns))),
+                elements=len(patterns),
+                flags=[flags] * len(patterns)
+            )
+            return db
+        except Exception as e:
+            logger.warning("Hyperscan compile failed, using regex gate checks: %s", e)
+            return None
+
+    def _scan_categories(self, jd_text: str) -> Optional[Set[str]]:
+        """Find which yes/no categories match the JD in a single hyperscan pass.
+
+        Returns:
+            Names of matching categories, or None when hyperscan is unavailable
+        """
+        if self._scan_db is None:
+            return None
+
+        names = list(self.category_patterns)
+        hits = set()
+
+        def on_match(pattern_id, start, end, flags, context):
+            hits.add(names[pattern_id])
+
+        with self._scan_lock:
+            self._scan_db.scan(jd_text.encode('utf-8'), match_event_handler=on_match)
+        return hits
+
+    def _has_match(self, category: str, jd_text: str, hits: Optional[Set[str]]) -> bool:
+        """Check a yes/no category, using precomputed scan hits when available."""
+        if hits is not None:
+            return category in hits
+        return bool(self.category_patterns[category].search(jd_text))
+
+    def _check_education_requirements(self, jd_text: str, profile: Dict,
+                                      hits: Optional[Set[str]] = None) -> Dict[str, Any]:
         """Check if candidate meets education requirements."""
 
         # Check if there are hard education requirements
-        has_hard_requirement = any(
-            re.search(pattern, jd_text)
-            for pattern in self.education_patterns['hard_requirement_indicators']
-        )
+        has_hard_requirement = self._has_match('hard_requirement_indicators', jd_text, hits)
 
         if not has_hard_requirement:
             return {
@@ -171,16 +312,10 @@ class GateCheckAgent(BaseAgent):
             }
 
         # Check for quantitative bachelor requirement
-        requires_quant_bachelor = any(
-            re.search(pattern, jd_text)
-            for pattern in self.education_patterns['quantitative_bachelor']
-        )
+        requires_quant_bachelor = self._has_match('quantitative_bachelor', jd_text, hits)
 
         # Check for any master's degree alternative
-        accepts_masters = any(
-            re.search(pattern, jd_text)
-            for pattern in self.education_patterns['any_masters']
-        )
+        accepts_masters = self._has_match('any_masters', jd_text, hits)
 
         # Get candidate's education
         candidate_education = profile.get('education', {})
@@ -213,22 +348,14 @@ class GateCheckAgent(BaseAgent):
 
     def _is_quantitative_field(self, field: str) -> bool:
         """Check if education field is considered quantitative."""
-        quant_fields = [
-            'statistics', 'economics', 'mathematics', 'computer science',
-            'engineering', 'physics', 'operations research', 'analytics',
-            'information systems', 'finance', 'accounting', 'data science'
-        ]
-
-        return any(qfield in field for qfield in quant_fields)
+        return QUANTITATIVE_FIELD_RE.search(field) is not None
 
-    def _check_location_requirements(self, jd_text: str, profile: Dict) -> Dict[str, Any]:
+    def _check_location_requirements(self, jd_text: str, profile: Dict,
+                                     hits: Optional[Set[str]] = None) -> Dict[str, Any]:
         """Check location compatibility."""
 
         # Check for no remote work
-        no_remote = any(
-            re.search(pattern, jd_text)
-            for pattern in self.location_patterns['no_remote']
-        )
+        no_remote = self._has_match('no_remote', jd_text, hits)
 
         candidate_location = profile.get('location', {})
         candidate_remote_ok = candidate_location.get('remote_ok', True)
@@ -244,7 +371,7 @@ class GateCheckAgent(BaseAgent):
 
         # Check for specific location requirements
         for pattern in self.location_patterns['specific_location']:
-            match = re.search(pattern, jd_text)
+            match = pattern.search(jd_text)
             if match:
                 required_location = match.group(1).strip()
                 if candidate_city.lower() not in required_location.lower():
@@ -260,13 +387,11 @@ class GateCheckAgent(BaseAgent):
             'details': 'No location conflicts detected'
         }
 
-    def _check_work_authorization(self, jd_text: str, profile: Dict) -> Dict[str, Any]:
+    def _check_work_authorization(self, jd_text: str, profile: Dict,
+                                  hits: Optional[Set[str]] = None) -> Dict[str, Any]:
         """Check work authorization requirements."""
 
-        requires_auth = any(
-            re.search(pattern, jd_text)
-            for pattern in self.authorization_patterns
-        )
+        requires_auth = self._has_match('work_authorization', jd_text, hits)
 
         if requires_auth:
             candidate_auth = profile.get('work_authorization', {})
@@ -285,13 +410,14 @@ class GateCheckAgent(BaseAgent):
             'details': 'No authorization conflicts detected'
         }
 
-    def _check_experience_requirements(self, jd_text: str, profile: Dict) -> Dict[str, Any]:
+    def _check_experience_requirements(self, jd_text: str, profile: Dict,
+                                       hits: Optional[Set[str]] = None) -> Dict[str, Any]:
         """Check experience requirements."""
 
         # Extract years of experience required
         required_years = None
         for pattern in self.experience_patterns:
-            match = re.search(pattern, jd_text)
+            match = pattern.search(jd_text)
             if match:
                 required_years = int(match.group(1))
                 break
@@ -1,16 +1,194 @@
 """Strategic positioning agent - determines optimal narrative angle."""
 
+import asyncio
+import functools
+import heapq
 import json
+import logging
+import os
+import re
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Pattern, Tuple
 import yaml
 
+try:
+    import orjson
+    orjson_available = True
+except ImportError:
+    orjson_available = False
+
 from agents.base_agent import BaseAgent, AgentResponse
-from utils import get_logger, log_kv, NarrativeStore
+from utils import get_logger, log_kv, NarrativeStore, normalize_voice_blend
 from core import AgentMessage, MessageType
 
 logger = get_logger("positioning_agent")
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+
+def _compile_classifier(categories: Dict[str, Tuple[str, ...]]) -> Pattern:
+    """Compile keyword groups into one regex that names the first matching group.
+
+    Each category becomes a named, zero-width lookahead anchored at the
+    start of the text. Alternatives are tried in the order given, so
+    ``match().lastgroup`` reports the highest-priority category with a
+    keyword anywhere in the text (substring semantics, like ``in``).
+    """
+    branches = (
+        f"(?P<{name}>(?=.*?(?:{'|'.join(re.escape(term) for term in terms)})))"
+        for name, terms in categories.items()
+    )
+    return re.compile(r'\A(?:' + '|'.join(branches) + ')', re.DOTALL)
+
+
+# Role and industry classifiers, in priority order
+ROLE_CLASS_RE = _compile_classifier({
+    'director': ('director', 'vp', 'vice president', 'head'),
+    'principal': ('principal', 'staff', 'lead'),
+})
+
+# Well-known companies per industry, matched as whole name tokens first
+# and as substrings (e.g. "bookinghotels") only when no token matches
+TRAVEL_COMPANIES = frozenset({'airbnb', 'booking', 'expedia', 'tripadvisor', 'kayak'})
+MARKETPLACE_COMPANIES = frozenset({'etsy', 'ebay', 'amazon', 'doordash', 'uber', 'instacart'})
+COMPANY_TOKEN_RE = re.compile(r'[a-z]+')
+
+COMPANY_INDUSTRY_RE = _compile_classifier({
+    'travel': tuple(sorted(TRAVEL_COMPANIES)),
+    'marketplace': tuple(sorted(MARKETPLACE_COMPANIES)),
+})
+
+INDUSTRY_CLASS_RE = _compile_classifier({
+    'travel': ('travel', 'hospitality', 'hotel', 'airline'),
+    'marketplace': ('marketplace', 'ecommerce', 'platform'),
+    'b2b_saas': ('saas', 'b2b', 'enterprise', 'software'),
+    'ai_platform': ('ai', 'ml', 'artificial intelligence'),
+})
+
+# Metrics worth adding when a scoring category is among the strongest
+CATEGORY_METRICS = {
+    'outcomes_metrics': ('$[X.X]M+ impact', '[XXX]% YoY growth growth', '[XX]% retention rate'),
+    'scope_seniority': ('50+ managed', '25+ built', '15-20 led'),
+    'experimentation': ('47 A/B tests', 'data-driven decisions'),
+    'domain_technical': ('AI/ML implementation', 'marketplace expertise'),
+}
+
+# Fallbacks returned by the _get_* helpers. They are shared, so callers
+# copy before mutating
+DEFAULT_VOICE_PROFILES = {
+    'voice_blend': {
+        'default': {
+            'mo_gawdat': 50,
+            'john_mulaney': 30,
+            'bill_maher': 20
+        }
+    }
+}
+
+DEFAULT_STRATEGY = {
+    'primary_angle': 'experienced_product_leader',
+    'key_metrics': ('$[X.X]M+ impact', '[X] years management', '[XX]% retention rate'),
+    'voice_blend': {
+        'mo_gawdat': 50,
+        'john_mulaney': 30,
+        'bill_maher': 20
+    },
+    'industry_language': 'product excellence, user focus, data-driven',
+    'hook_template': "My track record of driving product transformation positions me to contribute immediately to [Company]'s growth.",
+    'gap_mitigation': "Focus on transferable skills and learning agility"
+}
+
+GROWTH_TRAJECTORY_STRATEGY = {
+    'primary_angle': 'founder_to_pm_growth',
+    'key_metrics': ('Built 2 startups', '0→1 experience', 'Full product lifecycle'),
+    'voice_blend': {
+        'mo_gawdat': 40,
+        'john_mulaney': 40,
+        'bill_maher': 20
+    },
+    'industry_language': 'startup agility, rapid iteration, customer obsession, scrappy execution',
+    'hook_template': "My founder experience building products from 0→1 brings unique perspective on rapid iteration and customer validation to [Company].",
+    'gap_mitigation': "Leverage startup experience as strength, position as high-growth potential"
+}
+
+# Culture keywords that shift the voice blend, checked in this order
+COLLABORATIVE_CULTURE = frozenset({'collaborative', 'inclusive', 'supportive'})
+FAST_PACED_CULTURE = frozenset({'fast-paced', 'aggressive', 'results'})
+TECHNICAL_CULTURE = frozenset({'technical', 'engineering', 'data'})
+
+# Every category the classifiers can return, including their defaults
+ROLE_TYPES = (*ROLE_CLASS_RE.groupindex, 'senior')
+INDUSTRY_TYPES = tuple(dict.fromkeys((*COMPANY_INDUSTRY_RE.groupindex, *INDUSTRY_CLASS_RE.groupindex, 'general')))
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file, using orjson when it is installed."""
+    if orjson_available:
+        return orjson.loads(path.read_bytes())
+
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def _load_yaml_with_json_cache(path: Path) -> Any:
+    """Parse a YAML file, reusing a JSON copy written on an earlier load.
+
+    The copy lives next to the source as ``<name>.json`` and records the
+    source's modification time and size; it is rebuilt whenever either
+    changes. Failing to write it only costs the speedup on the next load.
+    """
+    stat = path.stat()
+    cache_file = path.with_name(path.name + '.json')
+
+    try:
+        cached = _read_json(cache_file)
+        if cached['_mtime_ns'] == stat.st_mtime_ns and cached['_size'] == stat.st_size:
+            return cached['data']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    with open(path, 'r') as f:
+        data = yaml.load(f, Loader=YAML_LOADER)
+
+    # Write to a temp file and swap it in so readers never see a partial copy
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_file, 'w') as f:
+            json.dump({'_mtime_ns': stat.st_mtime_ns, '_size': stat.st_size, 'data': data}, f)
+        os.replace(tmp_file, cache_file)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug("Could not write JSON cache for %s: %s", path, e)
+        try:
+            tmp_file.unlink()
+        except OSError:
+            pass
+
+    return data
+
+
+@functools.lru_cache(maxsize=32)
+def _read_strategies(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse the positioning strategies file, shared across agent instances.
+
+    Modification time and size are part of the cache key so edits on
+    disk are picked up without restarting the process.
+    """
+    data = _read_json(Path(path))
+
+    # Store each strategy's metrics as a tuple so the shared copy can't be
+    # mutated and every strategy is guaranteed to have them
+    return {
+        name: {**strategy, 'key_metrics': tuple(strategy.get('key_metrics', ()))}
+        for name, strategy in data.get('positioning_strategies', {}).items()
+    }
+
+
+@functools.lru_cache(maxsize=32)
+def _read_voice_profiles(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse the voice calibration profiles, shared across agent instances."""
+    return _load_yaml_with_json_cache(Path(path))
+
 
 class PositioningAgent(BaseAgent):
     """Determines strategic positioning based on role, company, and industry."""
@@ -23,15 +201,69 @@ class PositioningAgent(BaseAgent):
         """
         super().__init__("positioning_agent", config, logger)
 
-        # Load positioning strategies
-        self.strategies = self._load_strategies()
-        self.voice_profiles = self._load_voice_profiles()
+        # Strategies and voice profiles are read from disk in async_init()
+        # so construction never blocks the event loop
+        self.strategies: Dict[str, Any] = {}
+        self.voice_profiles = self._get_default_voice_profiles()
+        self._index_strategies()
+        self._ready = False
+
+        # Resolved strategy keys, keyed by the inputs that decide them (LRU)
+        self.strategy_cache_size = self.config.get('strategy_cache_size', 1024)
+        self._strategy_cache: "OrderedDict[Tuple[str, str, str, int], Tuple[Optional[str], Optional[str]]]" = OrderedDict()
+
+        # Narrative store walks the narrative directories, so it is only
+        # built when something first asks for it
+        self.narrative_paths = [Path(p) for p in config.get("narrative_paths", ["knowledge/narrative"])]
+        self._narrative_store: Optional[NarrativeStore] = None
+
+    @property
+    def narrative_store(self) -> NarrativeStore:
+        """Narrative store, loaded on first access."""
+        if self._narrative_store is None:
+            self._narrative_store = NarrativeStore(self.narrative_paths)
+        return self._narrative_store
+
+    async def async_init(self) -> None:
+        """Load strategies and voice profiles in worker threads.
+
+        Safe to call repeatedly; process() calls it before first use.
+        """
+        if self._ready:
+            return
+
+        strategies, voice_profiles = await asyncio.gather(
+            asyncio.to_thread(self._load_strategies),
+            asyncio.to_thread(self._load_voice_profiles)
+        )
+
+        self.strategies = strategies
+        self.voice_profiles = voice_profiles
+        self._index_strategies()
+        self._strategy_cache.clear()
+        self._ready = True
 
-        # Initialize narrative store
-        narrative_paths = [Path(p) for p in config.get("narrative_paths", ["knowledge/narrative"])]
-        self.narrative_store = NarrativeStore(narrative_paths)
+        logger.info("Loaded %d positioning strategies", len(self.strategies))
 
-        logger.info(f"Loaded {len(self.strategies)} positioning strategies")
+    def _index_strategies(self) -> None:
+        """Index strategy keys for lookup by classified role and industry.
+
+        Exact ``role_industry`` keys are indexed by (role, industry) pair;
+        the first key for each role prefix and industry suffix covers the
+        partial-match fallbacks.
+        """
+        self._by_pair = {
+            tuple(key.split('_', 1)): key
+            for key in self.strategies if '_' in key
+        }
+        self._by_role = {
+            role_type: next((key for key in self.strategies if key.startswith(role_type)), None)
+            for role_type in ROLE_TYPES
+        }
+        self._by_industry = {
+            industry_type: next((key for key in self.strategies if key.endswith(industry_type)), None)
+            for industry_type in INDUSTRY_TYPES
+        }
 
     def _load_strategies(self) -> Dict[str, Any]:
         """Load positioning strategies from knowledge base."""
@@ -42,11 +274,10 @@ class PositioningAgent(BaseAgent):
             return {}
 
         try:
-            with open(strategies_file, 'r') as f:
-                data = json.load(f)
-            return data.get('positioning_strategies', {})
+            stat = strategies_file.stat()
+            return _read_strategies(str(strategies_file.resolve()), stat.st_mtime_ns, stat.st_size)
         except Exception as e:
-            logger.error(f"Failed to load strategies: {e}")
+            logger.error("Failed to load strategies: %s", e)
             return {}
 
     def _load_voice_profiles(self) -> Dict[str, Any]:
@@ -58,24 +289,15 @@ class PositioningAgent(BaseAgent):
             return self._get_default_voice_profiles()
 
         try:
-            with open(voice_file, 'r') as f:
-                data = yaml.safe_load(f)
-            return data
+            stat = voice_file.stat()
+            return _read_voice_profiles(str(voice_file.resolve()), stat.st_mtime_ns, stat.st_size)
         except Exception as e:
-            logger.error(f"Failed to load voice profiles: {e}")
+            logger.error("Failed to load voice profiles: %s", e)
             return self._get_default_voice_profiles()
 
     def _get_default_voice_profiles(self) -> Dict[str, Any]:
         """Get default voice profiles if file not found."""
-        return {
-            'voice_blend': {
-                'default': {
-                    'mo_gawdat': 50,
-                    'john_mulaney': 30,
-                    'bill_maher': 20
-                }
-            }
-        }
+        return DEFAULT_VOICE_PROFILES
 
     async def process(self, data: Any) -> AgentResponse:
         """Process positioning request.
@@ -87,20 +309,23 @@ class PositioningAgent(BaseAgent):
             Positioning strategy response
         """
         try:
+            await self.async_init()
+
             # Extract inputs
             job_data = data.get('job_data', {})
             research_data = data.get('research_data', {})
             scoring_result = data.get('scoring_result', {})
             workflow_config = data.get('workflow_config', {})
 
-            # Log inputs
-            log_kv(logger, "positioning_request",
-                company=job_data.get('company'),
-                role=job_data.get('role'),
-                score=scoring_result.get('total_score', 0))
+            # Log inputs (skip building the fields when INFO is filtered out)
+            if logger.isEnabledFor(logging.INFO):
+                log_kv(logger, "positioning_request",
+                    company=job_data.get('company'),
+                    role=job_data.get('role'),
+                    score=scoring_result.get('total_score', 0))
 
             # Determine positioning strategy
-            strategy = await self._determine_strategy(
+            strategy = self._determine_strategy(
                 job_data=job_data,
                 research_data=research_data,
                 scoring_result=scoring_result,
@@ -144,9 +369,10 @@ class PositioningAgent(BaseAgent):
             }
 
             # Log result
-            log_kv(logger, "positioning_determined",
-                strategy=positioning_result['strategy_name'],
-                voice_blend=str(voice_blend))
+            if logger.isEnabledFor(logging.INFO):
+                log_kv(logger, "positioning_determined",
+                    strategy=positioning_result['strategy_name'],
+                    voice_blend=str(voice_blend))
 
             return AgentResponse(
                 success=True,
@@ -159,17 +385,17 @@ class PositioningAgent(BaseAgent):
             )
 
         except Exception as e:
-            logger.error(f"Positioning failed: {e}")
+            logger.error("Positioning failed: %s", e)
             return AgentResponse(
                 success=False,
                 errors=[str(e)]
             )
 
-    async def _determine_strategy(self,
-                                 job_data: Dict[str, Any],
-                                 research_data: Dict[str, Any],
-                                 scoring_result: Dict[str, Any],
-                                 workflow_config: Dict[str, Any]) -> Dict[str, Any]:
+    def _determine_strategy(self,
+                            job_data: Dict[str, Any],
+                            research_data: Dict[str, Any],
+                            scoring_result: Dict[str, Any],
+                            workflow_config: Dict[str, Any]) -> Dict[str, Any]:
         """Determine optimal positioning strategy.
 
         Args:
@@ -185,72 +411,95 @@ class PositioningAgent(BaseAgent):
         company = job_data.get('company', '').lower()
         industry = research_data.get('industry', '').lower()
 
+        # Score only matters against the 55/70 thresholds, so bucket it
+        # to keep the cache key small
+        score_bucket = int(scoring_result.get('total_score', 0) // 5)
+
+        cache_key = (role, company, industry, score_bucket)
+        resolved = self._strategy_cache.get(cache_key)
+
+        if resolved is not None:
+            self._strategy_cache.move_to_end(cache_key)
+        else:
+            resolved = self._resolve_strategy_key(role, company, industry, score_bucket)
+            if self.strategy_cache_size > 0:
+                self._strategy_cache[cache_key] = resolved
+                while len(self._strategy_cache) > self.strategy_cache_size:
+                    self._strategy_cache.popitem(last=False)
+
+        strategy_key, match_kind = resolved
+        if match_kind:
+            logger.info("Using %s: %s", match_kind, strategy_key)
+
+        if strategy_key is None:
+            return self._get_growth_trajectory_strategy()
+        return self.strategies.get(strategy_key, self._get_default_strategy())
+
+    def _resolve_strategy_key(self,
+                              role: str,
+                              company: str,
+                              industry: str,
+                              score_bucket: int) -> Tuple[Optional[str], Optional[str]]:
+        """Work out which strategy applies to a role/company/industry.
+
+        Args:
+            role: Lowercased role title
+            company: Lowercased company name
+            industry: Lowercased industry
+            score_bucket: Total score divided by 5, rounded down
+
+        Returns:
+            Tuple of (strategy key, how it matched). The key is None for the
+            growth trajectory strategy; the match kind is None for score-based
+            defaults.
+        """
         # Check for exact match first
         role_type = self._classify_role(role)
         industry_type = self._classify_industry(industry, company)
 
-        strategy_key = f"{role_type}_{industry_type}"
-
-        if strategy_key in self.strategies:
-            logger.info(f"Using exact strategy match: {strategy_key}")
-            return self.strategies[strategy_key]
+        strategy_key = self._by_pair.get((role_type, industry_type))
+        if strategy_key is not None:
+            return strategy_key, "exact strategy match"
 
         # Try role-only match
-        for key, strategy in self.strategies.items():
-            if key.startswith(role_type):
-                logger.info(f"Using role-based strategy: {key}")
-                return strategy
+        key = self._by_role.get(role_type)
+        if key is not None:
+            return key, "role-based strategy"
 
         # Try industry-only match
-        for key, strategy in self.strategies.items():
-            if key.endswith(industry_type):
-                logger.info(f"Using industry-based strategy: {key}")
-                return strategy
+        key = self._by_industry.get(industry_type)
+        if key is not None:
+            return key, "industry-based strategy"
 
         # Use default based on score - adjusted for career stage
-        if scoring_result.get('total_score', 0) >= 70:
-            return self.strategies.get('senior_marketplace', self._get_default_strategy())
-        elif scoring_result.get('total_score', 0) >= 55:
-            return self.strategies.get('senior_product', self._get_default_strategy())
-        else:
-            return self._get_growth_trajectory_strategy()
-
-    def _classify_role(self, role: str) -> str:
-        """Classify role into category."""
-        role_lower = role.lower()
-
-        if any(term in role_lower for term in ['director', 'vp', 'vice president', 'head']):
-            return 'director'
-        elif any(term in role_lower for term in ['principal', 'staff', 'lead']):
-            return 'principal'
+        if score_bucket * 5 >= 70:
+            return 'senior_marketplace', None
+        elif score_bucket * 5 >= 55:
+            return 'senior_product', None
         else:
-            return 'senior'
+            return None, None
 
-    def _classify_industry(self, industry: str, company: str) -> str:
-        """Classify industry into category."""
-        industry_lower = industry.lower()
-        company_lower = company.lower()
+    def _classify_role(self, role_lower: str) -> str:
+        """Classify an already lowercased role into category."""
+        match = ROLE_CLASS_RE.match(role_lower)
+        return match.lastgroup if match else 'senior'
 
+    def _classify_industry(self, industry_lower: str, company_lower: str) -> str:
+        """Classify an already lowercased industry/company into category."""
         # Check specific companies first
-        travel_companies = ['airbnb', 'booking', 'expedia', 'tripadvisor', 'kayak']
-        if any(comp in company_lower for comp in travel_companies):
+        tokens = set(COMPANY_TOKEN_RE.findall(company_lower))
+        if tokens & TRAVEL_COMPANIES:
             return 'travel'
-
-        marketplace_companies = ['etsy', 'ebay', 'amazon', 'doordash', 'uber', 'instacart']
-        if any(comp in company_lower for comp in marketplace_companies):
+        if tokens & MARKETPLACE_COMPANIES:
             return 'marketplace'
 
+        match = COMPANY_INDUSTRY_RE.match(company_lower)
+        if match:
+            return match.lastgroup
+
         # Check industry keywords
-        if any(term in industry_lower for term in ['travel', 'hospitality', 'hotel', 'airline']):
-            return 'travel'
-        elif any(term in industry_lower for term in ['marketplace', 'ecommerce', 'platform']):
-            return 'marketplace'
-        elif any(term in industry_lower for term in ['saas', 'b2b', 'enterprise', 'software']):
-            return 'b2b_saas'
-        elif any(term in industry_lower for term in ['ai', 'ml', 'artificial intelligence']):
-            return 'ai_platform'
-        else:
-            return 'general'
+        match = INDUSTRY_CLASS_RE.match(industry_lower)
+        return match.lastgroup if match else 'general'
 
     def _select_key_metrics(self,
                            strategy: Dict[str, Any],
@@ -265,32 +514,20 @@ class PositioningAgent(BaseAgent):
             List of key metrics to emphasize
         """
         # Start with strategy-recommended metrics
-        metrics = strategy.get('key_metrics', []).copy()
+        # Insertion-ordered dict doubles as an ordered set for de-duplication
+        metrics = dict.fromkeys(strategy['key_metrics'])
 
         # Add high-scoring categories
         category_scores = scoring_result.get('category_breakdown', {})
-        top_categories = sorted(
-            category_scores.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:3]
-
-        # Map categories to metrics
-        metric_map = {
-            'outcomes_metrics': ['$[X.X]M+ impact', '[XXX]% YoY growth growth', '[XX]% retention rate'],
-            'scope_seniority': ['50+ managed', '25+ built', '15-20 led'],
-            'experimentation': ['47 A/B tests', 'data-driven decisions'],
-            'domain_technical': ['AI/ML implementation', 'marketplace expertise']
-        }
+        top_categories = heapq.nlargest(3, category_scores.items(), key=lambda x: x[1])
 
         for category, score in top_categories:
-            if category in metric_map and score >= 4:
-                for metric in metric_map[category]:
-                    if metric not in metrics:
-                        metrics.append(metric)
+            if category in CATEGORY_METRICS and score >= 4:
+                for metric in CATEGORY_METRICS[category]:
+                    metrics.setdefault(metric)
 
         # Limit to top 5 metrics
-        return metrics[:5]
+        return list(metrics)[:5]
 
     def _identify_gap_mitigation(self,
                                 scoring_result: Dict[str, Any],
@@ -356,37 +593,33 @@ class PositioningAgent(BaseAgent):
 
         if not voice_blend:
             # Use default
+            # Copy: the profiles are shared with other agent instances
             voice_blend = self.voice_profiles.get('voice_blend', {}).get('default', {
                 'mo_gawdat': 50,
                 'john_mulaney': 30,
                 'bill_maher': 20
-            })
+            }).copy()
 
         # Adjust based on company culture
-        culture_keywords = company_culture.get('keywords', [])
+        culture_keywords = frozenset(company_culture.get('keywords', ()))
 
-        if any(term in culture_keywords for term in ['collaborative', 'inclusive', 'supportive']):
+        if culture_keywords & COLLABORATIVE_CULTURE:
             # More wisdom, less directness
             voice_blend['mo_gawdat'] = min(voice_blend.get('mo_gawdat', 50) + 10, 70)
             voice_blend['bill_maher'] = max(voice_blend.get('bill_maher', 20) - 10, 10)
 
-        elif any(term in culture_keywords for term in ['fast-paced', 'aggressive', 'results']):
+        elif culture_keywords & FAST_PACED_CULTURE:
             # More directness
             voice_blend['bill_maher'] = min(voice_blend.get('bill_maher', 20) + 10, 35)
             voice_blend['mo_gawdat'] = max(voice_blend.get('mo_gawdat', 50) - 5, 40)
 
-        elif any(term in culture_keywords for term in ['technical', 'engineering', 'data']):
+        elif culture_keywords & TECHNICAL_CULTURE:
             # More precision
             voice_blend['john_mulaney'] = min(voice_blend.get('john_mulaney', 30) + 15, 50)
             voice_blend['mo_gawdat'] = max(voice_blend.get('mo_gawdat', 50) - 10, 35)
 
         # Normalize to 100%
-        total = sum(voice_blend.values())
-        if total != 100:
-            factor = 100 / total
-            voice_blend = {k: int(v * factor) for k, v in voice_blend.items()}
-
-        return voice_blend
+        return normalize_voice_blend(voice_blend)
 
     def _create_hook(self,
                     strategy: Dict[str, Any],
@@ -411,13 +644,13 @@ class PositioningAgent(BaseAgent):
             # Add recent context if available
             recent_news = research_data.get('recent_news', '')
             if recent_news:
-                hook = f"With {company}'s {recent_news}, " + hook[0].lower() + hook[1:]
+                hook = f"With {company}'s {recent_news}, {hook[:1].lower()}{hook[1:]}"
 
             return hook
 
         # Generate default hook
         angle = strategy.get('primary_angle', 'product leadership')
-        key_metric = strategy.get('key_metrics', ['[XX]+ years experience'])[0]
+        key_metric = (strategy.get('key_metrics') or ('[XX]+ years experience',))[0]
 
         return f"My experience {key_metric} uniquely positions me to drive {company}'s {angle} forward."
 
@@ -439,33 +672,11 @@ class PositioningAgent(BaseAgent):
 
     def _get_default_strategy(self) -> Dict[str, Any]:
         """Get default positioning strategy."""
-        return {
-            'primary_angle': 'experienced_product_leader',
-            'key_metrics': ['$[X.X]M+ impact', '[X] years management', '[XX]% retention rate'],
-            'voice_blend': {
-                'mo_gawdat': 50,
-                'john_mulaney': 30,
-                'bill_maher': 20
-            },
-            'industry_language': 'product excellence, user focus, data-driven',
-            'hook_template': "My track record of driving product transformation positions me to contribute immediately to [Company]'s growth.",
-            'gap_mitigation': "Focus on transferable skills and learning agility"
-        }
+        return DEFAULT_STRATEGY
 
     def _get_growth_trajectory_strategy(self) -> Dict[str, Any]:
         """Get growth trajectory strategy for founder -> PM transition."""
-        return {
-            'primary_angle': 'founder_to_pm_growth',
-            'key_metrics': ['Built 2 startups', '0→1 experience', 'Full product lifecycle'],
-            'voice_blend': {
-                'mo_gawdat': 40,
-                'john_mulaney': 40,
-                'bill_maher': 20
-            },
-            'industry_language': 'startup agility, rapid iteration, customer obsession, scrappy execution',
-            'hook_template': "My founder experience building products from 0→1 brings unique perspective on rapid iteration and customer validation to [Company].",
-            'gap_mitigation': "Leverage startup experience as strength, position as high-growth potential"
-        }
+        return GROWTH_TRAJECTORY_STRATEGY
 
     async def handle_message(self, message: AgentMessage) -> None:
         """Handle incoming messages.
@@ -482,8 +693,8 @@ class PositioningAgent(BaseAgent):
                 sender=self.name,
                 recipient=message.sender,
                 message_type=MessageType.POSITIONING_STRATEGY,
-                data=result.dict(),
+                data=result.model_dump(),
                 correlation_id=message.correlation_id
             )
 
-            await self.message_bus.send(response)
\ No newline at end of file
+            await self._send(response)
\ No newline at end of file
@@ -1,17 +1,59 @@
 """Research agent - consolidates company intelligence gathering."""
 
 import asyncio
+import heapq
 import json
-from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
-import hashlib
+import logging
+import re
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, List, Tuple
+from datetime import datetime, timedelta, timezone
 
 from agents.base_agent import BaseAgent, AgentResponse
+from agents.research_profiles import (
+    COMPANIES, INDUSTRIES, INDUSTRY_COMPANIES, CULTURES,
+    DEFAULT_INDUSTRY, DEFAULT_CULTURE
+)
 from utils import get_logger, log_kv
 from core import AgentMessage, MessageType
 
 logger = get_logger("research_agent")
 
+_utc_timestamp_cache = {'second': None, 'value': ''}
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time as ISO-8601, formatted at most once per second."""
+    second = int(time.time())
+    if second != _utc_timestamp_cache['second']:
+        _utc_timestamp_cache['value'] = datetime.fromtimestamp(second, timezone.utc).isoformat()
+        _utc_timestamp_cache['second'] = second
+    return _utc_timestamp_cache['value']
+
+
+# One pass over the company name picks the first industry (in
+# INDUSTRY_COMPANIES order) with a keyword anywhere in it: each
+# industry is a named lookahead anchored at the start, so
+# match().lastgroup names the winner
+INDUSTRY_COMPANY_RE = re.compile(
+    r'\A(?:' + '|'.join(
+        f"(?P<{industry}>(?=.*?(?:{'|'.join(re.escape(name) for name in companies)})))"
+        for industry, companies in INDUSTRY_COMPANIES.items()
+    ) + ')',
+    re.DOTALL
+)
+
+# Points each research field contributes to the quality assessment when present
+RESEARCH_QUALITY_WEIGHTS: Tuple[Tuple[str, int], ...] = (
+    ('industry', 2),
+    ('culture', 2),
+    ('recent_news', 3),
+    ('tech_stack', 1),
+    ('focus_areas', 2)
+)
+
 
 class ResearchAgent(BaseAgent):
     """Consolidated research agent for company and role intelligence."""
@@ -26,11 +68,23 @@ class ResearchAgent(BaseAgent):
 
         # Cache configuration
         self.cache_ttl = timedelta(hours=config.get('cache_ttl_hours', 24))
-        self.research_cache: Dict[str, Any] = {}
+        self._ttl_seconds = self.cache_ttl.total_seconds()
+        self.max_cache_entries = config.get('max_cache_entries', 1024)
+
+        # (expiry, research) per key in LRU order, plus a min-heap of
+        # (expiry, key) so expired entries are dropped without a full scan.
+        # Expiries are time.monotonic() values, immune to wall-clock jumps
+        self.research_cache: "OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._expiry_heap: List[Tuple[float, Tuple[str, str]]] = []
+
+        # Futures for research currently running, so concurrent identical
+        # requests share one pipeline run
+        self._inflight: Dict[Tuple[str, str], "asyncio.Future[Dict[str, Any]]"] = {}
 
         # API configurations (will be loaded from env)
         self.tavily_api_key = config.get('tavily_api_key')
         self.enable_web_search = config.get('enable_web_search', True)
+        self._news_semaphore = asyncio.Semaphore(config.get('max_concurrent_news', 4))
 
         logger.info("Research Agent initialized with caching enabled")
 
@@ -47,55 +101,72 @@ class ResearchAgent(BaseAgent):
             job_data = data.get('job_data', {})
             company = job_data.get('company', '')
             role = job_data.get('role', '')
-            url = job_data.get('url', '')
-
-            # Log request
-            log_kv(logger, "research_request",
-                company=company,
-                role=role,
-                url=url)
 
-            # Check cache first
+            # Check cache first, before any other per-request work
             cache_key = self._get_cache_key(company, role)
             cached_result = self._get_cached_research(cache_key)
             if cached_result:
-                logger.info(f"Using cached research for {company}")
+                logger.info("Using cached research for %s", company)
                 return AgentResponse(
                     success=True,
                     result=cached_result,
                     metrics={'cache_hit': True, 'sources': len(cached_result.get('sources', []))}
                 )
 
-            # Perform parallel research
-            research_tasks = []
-
-            # Company intelligence
-            research_tasks.append(self._research_company(company, role))
-
-            # Industry analysis
-            research_tasks.append(self._research_industry(company))
-
-            # Recent news and announcements
-            if self.enable_web_search:
-                research_tasks.append(self._search_recent_news(company))
-
-            # Culture and values
-            research_tasks.append(self._research_culture(company))
-
-            # Execute all research in parallel
-            results = await asyncio.gather(*research_tasks, return_exceptions=True)
-
-            # Combine results
-            research_data = self._combine_research_results(results, company, role)
+            # Join an identical request that is already running. If that
+            # request is cancelled, this one takes over rather than being
+            # cancelled with it (another joiner may already have taken over)
+            inflight = self._inflight.get(cache_key)
+            while inflight is not None:
+                try:
+                    research_data = await asyncio.shield(inflight)
+                except asyncio.CancelledError:
+                    if not inflight.cancelled():
+                        raise
+                    inflight = self._inflight.get(cache_key)
+                    continue
+                logger.info("Joined in-flight research for %s", company)
+                return AgentResponse(
+                    success=True,
+                    result=research_data,
+                    metrics={
+                        'cache_hit': False,
+                        'coalesced': True,
+                        'sources': len(research_data.get('sources', []))
+                    }
+                )
 
-            # Cache the result
-            self._cache_research(cache_key, research_data)
+            # Log request (skip building the fields when INFO is filtered out)
+            if logger.isEnabledFor(logging.INFO):
+                log_kv(logger, "research_request",
+                    company=company,
+                    role=role,
+                    url=job_data.get('url', ''))
+
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[cache_key] = future
+            try:
+                research_data = await self._research(company, role, cache_key)
+                future.set_result(research_data)
+            except Exception as e:
+                future.set_exception(e)
+                # Joined callers re-raise it; don't report it as unretrieved
+                future.exception()
+                raise
+            finally:
+                if self._inflight.get(cache_key) is future:
+                    del self._inflight[cache_key]
+                # Only reached undone when this request was cancelled;
+                # joined requests see that and run the research themselves
+                if not future.done():
+                    future.cancel()
 
             # Log success
-            log_kv(logger, "research_complete",
-                company=company,
-                sources_found=len(research_data.get('sources', [])),
-                has_recent_news=bool(research_data.get('recent_news')))
+            if logger.isEnabledFor(logging.INFO):
+                log_kv(logger, "research_complete",
+                    company=company,
+                    sources_found=len(research_data.get('sources', [])),
+                    has_recent_news=bool(research_data.get('recent_news')))
 
             return AgentResponse(
                 success=True,
@@ -115,11 +186,60 @@ class ResearchAgent(BaseAgent):
                 errors=[str(e)]
             )
 
-    async def _research_company(self, company: str, role: str) -> Dict[str, Any]:
+    async def _research(self,
+                        company: str,
+                        role: str,
+                        cache_key: Tuple[str, str]) -> Dict[str, Any]:
+        """Gather, combine and cache research for a company and role.
+
+        Args:
+            company: Company name
+            role: Role title
+            cache_key: Cache key for the request
+
+        Returns:
+            Combined research data
+        """
+        # Company, industry and culture come from local profiles
+        local = self._classify(company, cache_key[0], role)
+
+        # Recent news and announcements
+        news = await self._search_recent_news(company) if self.enable_web_search else {}
+
+        # Combine results
+        research_data = self._combine_research_results(local, news, company, role)
+
+        # Cache the result
+        self._cache_research(cache_key, research_data)
+
+        return research_data
+
+    def _classify(self, company: str, company_cf: str, role: str) -> Dict[str, Any]:
+        """Run the local company, industry and culture lookups.
+
+        These are pure keyword lookups, so they run inline rather than as
+        separate tasks.
+
+        Args:
+            company: Company name
+            company_cf: Casefolded company name
+            role: Role title
+
+        Returns:
+            Merged company, industry and culture data
+        """
+        return {
+            **self._research_company(company, company_cf, role),
+            **self._research_industry(company_cf),
+            **self._research_culture(company_cf)
+        }
+
+    def _research_company(self, company: str, company_cf: str, role: str) -> Mapping[str, Any]:
         """Research company information.
 
         Args:
             company: Company name
+            company_cf: Casefolded company name
             role: Role title
 
         Returns:
@@ -129,108 +249,40 @@ class ResearchAgent(BaseAgent):
             # This would integrate with actual APIs in production
             # For now, returning structured mock data based on known companies
 
-            company_lower = company.lower()
-
             # Known company profiles (from v1 knowledge)
-            if 'airbnb' in company_lower:
-                return {
-                    'company': 'Airbnb',
-                    'industry': 'Travel & Hospitality',
-                    'stage': 'Public',
-                    'size': '5000+',
-                    'mission': 'Create a world where anyone can belong anywhere',
-                    'focus_areas': ['Guest experience', 'Host success', 'Global expansion'],
-                    'tech_stack': ['React', 'Ruby on Rails', 'AWS', 'Kubernetes'],
-                    'recent_initiatives': ['AI-powered search', 'Host passport program', 'Categories expansion']
-                }
-            elif 'etsy' in company_lower:
-                return {
-                    'company': 'Etsy',
-                    'industry': 'E-commerce Marketplace',
-                    'stage': 'Public',
-                    'size': '2000+',
-                    'mission': 'Keep commerce human',
-                    'focus_areas': ['Seller empowerment', 'Buyer discovery', 'Sustainable commerce'],
-                    'tech_stack': ['PHP', 'React', 'MySQL', 'Google Cloud'],
-                    'recent_initiatives': ['AI recommendations', 'Seller tools', 'International expansion']
-                }
-            elif 'stripe' in company_lower:
-                return {
-                    'company': 'Stripe',
-                    'industry': 'FinTech/Payments',
-                    'stage': 'Private',
-                    'size': '7000+',
-                    'mission': 'Increase the GDP of the internet',
-                    'focus_areas': ['Developer experience', 'Global payments', 'Platform economy'],
-                    'tech_stack': ['Ruby', 'Go', 'JavaScript', 'AWS'],
-                    'recent_initiatives': ['Stripe Apps', 'Revenue recognition', 'Climate commitment']
-                }
-            else:
-                # Generic company research
-                return {
-                    'company': company,
-                    'industry': 'Technology',
-                    'stage': 'Growth',
-                    'size': '100-500',
-                    'mission': f'Transform {role.split()[-1].lower()} through innovation',
-                    'focus_areas': ['Product excellence', 'Customer success', 'Growth'],
-                    'tech_stack': ['Modern stack'],
-                    'recent_initiatives': ['Digital transformation', 'AI adoption']
-                }
+            for name, profile in COMPANIES.items():
+                if name in company_cf:
+                    return profile
+
+            # Generic company research
+            return {
+                'company': company,
+                'industry': 'Technology',
+                'stage': 'Growth',
+                'size': '100-500',
+                'mission': f'Transform {role.split()[-1].lower()} through innovation',
+                'focus_areas': ['Product excellence', 'Customer success', 'Growth'],
+                'tech_stack': ['Modern stack'],
+                'recent_initiatives': ['Digital transformation', 'AI adoption']
+            }
 
         except Exception as e:
             logger.error(f"Company research failed: {e}")
             return {}
 
-    async def _research_industry(self, company: str) -> Dict[str, Any]:
+    def _research_industry(self, company_cf: str) -> Mapping[str, Any]:
         """Research industry context.
 
         Args:
-            company: Company name
+            company_cf: Casefolded company name
 
         Returns:
             Industry research data
         """
         try:
-            company_lower = company.lower()
-
             # Industry mapping
-            if any(term in company_lower for term in ['airbnb', 'booking', 'expedia', 'tripadvisor']):
-                return {
-                    'industry': 'Travel & Hospitality',
-                    'market_size': '$1.9T global travel market',
-                    'growth_rate': '7.5% CAGR',
-                    'key_trends': ['Experiential travel', 'Digital nomads', 'Sustainable tourism'],
-                    'competitors': ['Booking.com', 'Expedia', 'VRBO'],
-                    'challenges': ['Regulation', 'Trust & safety', 'Post-pandemic recovery']
-                }
-            elif any(term in company_lower for term in ['etsy', 'ebay', 'amazon', 'shopify']):
-                return {
-                    'industry': 'E-commerce Marketplace',
-                    'market_size': '$5.5T global e-commerce',
-                    'growth_rate': '9.7% CAGR',
-                    'key_trends': ['Social commerce', 'Creator economy', 'Personalization'],
-                    'competitors': ['Amazon Handmade', 'eBay', 'Facebook Marketplace'],
-                    'challenges': ['CAC growth', 'Platform differentiation', 'Seller retention']
-                }
-            elif any(term in company_lower for term in ['stripe', 'square', 'paypal', 'adyen']):
-                return {
-                    'industry': 'FinTech/Payments',
-                    'market_size': '$8.9T payment processing',
-                    'growth_rate': '11.2% CAGR',
-                    'key_trends': ['Embedded finance', 'Crypto payments', 'B2B payments'],
-                    'competitors': ['Square', 'PayPal', 'Adyen'],
-                    'challenges': ['Regulation', 'Fraud prevention', 'Global expansion']
-                }
-            else:
-                return {
-                    'industry': 'Technology',
-                    'market_size': 'Growing',
-                    'growth_rate': 'Double-digit',
-                    'key_trends': ['AI adoption', 'Digital transformation'],
-                    'competitors': ['Various'],
-                    'challenges': ['Talent acquisition', 'Innovation pace']
-                }
+            match = INDUSTRY_COMPANY_RE.match(company_cf)
+            return INDUSTRIES[match.lastgroup] if match else DEFAULT_INDUSTRY
 
         except Exception as e:
             logger.error(f"Industry research failed: {e}")
@@ -245,114 +297,93 @@ class ResearchAgent(BaseAgent):
         Returns:
             Recent news data
         """
-        try:
-            # In production, this would use Tavily API
-            # For now, return structured example
+        # Bound concurrent calls to the news API; extra requests queue here
+        # instead of tripping its rate limits
+        async with self._news_semaphore:
+            try:
+                # In production, this would use Tavily API
+                # For now, return structured example
 
-            return {
-                'recent_news': [
-                    {
-                        'date': '2024-11-01',
-                        'headline': f'{company} announces new product features',
-                        'summary': 'Expansion of core platform capabilities',
-                        'relevance': 'Product innovation focus'
-                    },
-                    {
-                        'date': '2024-10-15',
-                        'headline': f'{company} reports strong Q3 results',
-                        'summary': 'Revenue growth exceeds expectations',
-                        'relevance': 'Financial stability and growth'
-                    }
-                ],
-                'key_announcements': [
-                    'Recent funding round',
-                    'New executive hires',
-                    'Product launches'
-                ]
-            }
+                return {
+                    'recent_news': [
+                        {
+                            'date': '2024-11-01',
+                            'headline': f'{company} announces new product features',
+                            'summary': 'Expansion of core platform capabilities',
+                            'relevance': 'Product innovation focus'
+                        },
+                        {
+                            'date': '2024-10-15',
+                            'headline': f'{company} reports strong Q3 results',
+                            'summary': 'Revenue growth exceeds expectations',
+                            'relevance': 'Financial stability and growth'
+                        }
+                    ],
+                    'key_announcements': [
+                        'Recent funding round',
+                        'New executive hires',
+                        'Product launches'
+                    ]
+                }
 
-        except Exception as e:
-            logger.error(f"News search failed: {e}")
-            return {}
+            except Exception as e:
+                logger.error(f"News search failed: {e}")
+                return {}
 
-    async def _research_culture(self, company: str) -> Dict[str, Any]:
+    def _research_culture(self, company_cf: str) -> Mapping[str, Any]:
         """Research company culture and values.
 
         Args:
-            company: Company name
+            company_cf: Casefolded company name
 
         Returns:
             Culture research data
         """
         try:
-            company_lower = company.lower()
-
             # Culture profiles for known companies
-            if 'airbnb' in company_lower:
-                return {
-                    'culture': {
-                        'values': ['Belong anywhere', 'Champion the mission', 'Be a host'],
-                        'keywords': ['belonging', 'community', 'hospitality', 'global', 'inclusive'],
-                        'work_style': 'Flexible, remote-friendly, collaborative',
-                        'leadership_style': 'Mission-driven, data-informed, design-thinking',
-                        'employee_sentiment': 'Strong mission alignment, focus on impact'
-                    }
-                }
-            elif 'etsy' in company_lower:
-                return {
-                    'culture': {
-                        'values': ['Keep commerce human', 'Commitment to craft', 'Sustainable practice'],
-                        'keywords': ['human', 'creative', 'sustainable', 'authentic', 'community'],
-                        'work_style': 'Creative, autonomous, impact-focused',
-                        'leadership_style': 'Empowering, transparent, values-driven',
-                        'employee_sentiment': 'Purpose-driven, creative freedom'
-                    }
-                }
-            else:
-                return {
-                    'culture': {
-                        'values': ['Innovation', 'Customer focus', 'Excellence'],
-                        'keywords': ['collaborative', 'innovative', 'fast-paced', 'data-driven'],
-                        'work_style': 'Collaborative and results-oriented',
-                        'leadership_style': 'Strategic and empowering',
-                        'employee_sentiment': 'Growth-oriented'
-                    }
-                }
+            for name, profile in CULTURES.items():
+                if name in company_cf:
+                    return profile
+
+            return DEFAULT_CULTURE
 
         except Exception as e:
             logger.error(f"Culture research failed: {e}")
             return {}
 
     def _combine_research_results(self,
-                                 results: List[Any],
+                                 local: Mapping[str, Any],
+                                 news: Mapping[str, Any],
                                  company: str,
                                  role: str) -> Dict[str, Any]:
         """Combine research results from multiple sources.
 
+        Sources catch their own errors and return {} on failure.
+
         Args:
-            results: List of research results
+            local: Merged company, industry and culture research
+            news: Recent news research ({} when web search is off)
             company: Company name
             role: Role title
 
         Returns:
             Combined research data
         """
+        # Build the merged result in one pass; source keys override the
+        # request's company name, as they did when applied with update()
         combined = {
             'company': company,
             'role': role,
-            'researched_at': datetime.utcnow().isoformat(),
-            'sources': []
+            'researched_at': _utc_timestamp(),
+            'sources': [result['source'] for result in (local, news) if 'source' in result],
+            **local,
+            **news
         }
 
-        for result in results:
-            if isinstance(result, Exception):
-                logger.warning(f"Research task failed: {result}")
-                continue
-
-            if result:
-                combined.update(result)
-                if 'source' in result:
-                    combined['sources'].append(result['source'])
+        # Nested profile mappings are read-only; hand out plain dicts
+        for key, value in combined.items():
+            if isinstance(value, MappingProxyType):
+                combined[key] = dict(value)
 
         # Add research quality indicator
         combined['research_quality'] = self._assess_research_quality(combined)
@@ -368,18 +399,9 @@ class ResearchAgent(BaseAgent):
         Returns:
             Quality assessment (high/medium/low)
         """
-        quality_score = 0
-
-        if research_data.get('industry'):
-            quality_score += 2
-        if research_data.get('culture'):
-            quality_score += 2
-        if research_data.get('recent_news'):
-            quality_score += 3
-        if research_data.get('tech_stack'):
-            quality_score += 1
-        if research_data.get('focus_areas'):
-            quality_score += 2
+        quality_score = sum(
+            weight for key, weight in RESEARCH_QUALITY_WEIGHTS if research_data.get(key)
+        )
 
         if quality_score >= 8:
             return 'high'
@@ -388,7 +410,7 @@ class ResearchAgent(BaseAgent):
         else:
             return 'low'
 
-    def _get_cache_key(self, company: str, role: str) -> str:
+    def _get_cache_key(self, company: str, role: str) -> Tuple[str, str]:
         """Generate cache key for research.
 
         Args:
@@ -396,12 +418,11 @@ class ResearchAgent(BaseAgent):
             role: Role title
 
         Returns:
-            Cache key
+            Case-insensitive (company, role) key
         """
-        content = f"{company.lower()}:{role.lower()}"
-        return hashlib.md5(content.encode()).hexdigest()
+        return (company.casefold(), role.casefold())
 
-    def _get_cached_research(self, cache_key: str) -> Optional[Dict[str, Any]]:
+    def _get_cached_research(self, cache_key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
         """Get cached research if available and not expired.
 
         Args:
@@ -410,29 +431,59 @@ class ResearchAgent(BaseAgent):
         Returns:
             Cached research or None
         """
-        if cache_key not in self.research_cache:
+        # One lookup; an expired entry is dropped with pop() so a concurrent
+        # removal of the same key is harmless
+        entry = self.research_cache.get(cache_key)
+        if entry is None:
             return None
 
-        cached = self.research_cache[cache_key]
-        cached_time = datetime.fromisoformat(cached['researched_at'])
-
-        if datetime.utcnow() - cached_time > self.cache_ttl:
-            # Cache expired
-            del self.research_cache[cache_key]
+        expiry, research_data = entry
+        if expiry <= time.monotonic():
+            self.research_cache.pop(cache_key, None)
             return None
 
-        return cached
+        self.research_cache.move_to_end(cache_key)
+        return research_data
 
-    def _cache_research(self, cache_key: str, research_data: Dict[str, Any]) -> None:
+    def _cache_research(self, cache_key: Tuple[str, str], research_data: Dict[str, Any]) -> None:
         """Cache research data.
 
         Args:
             cache_key: Cache key
             research_data: Research data to cache
         """
-        self.research_cache[cache_key] = research_data
+        now = time.monotonic()
+        self._evict_expired(now)
+
+        expiry = now + self._ttl_seconds
+        self.research_cache[cache_key] = (expiry, research_data)
+        self.research_cache.move_to_end(cache_key)
+        heapq.heappush(self._expiry_heap, (expiry, cache_key))
+
+        while len(self.research_cache) > self.max_cache_entries:
+            self.research_cache.popitem(last=False)
+
+        # Overwritten and LRU-evicted keys leave stale heap entries behind;
+        # rebuild the heap from the live entries once they pile up
+        if len(self._expiry_heap) > 2 * self.max_cache_entries:
+            self._expiry_heap = [(expiry, key) for key, (expiry, _) in self.research_cache.items()]
+            heapq.heapify(self._expiry_heap)
+
         logger.debug(f"Cached research for key: {cache_key}")
 
+    def _evict_expired(self, now: float) -> None:
+        """Drop cache entries whose TTL has passed.
+
+        Args:
+            now: Current time.monotonic() value
+        """
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            expiry, key = heapq.heappop(self._expiry_heap)
+            entry = self.research_cache.get(key)
+            # Skip heap entries for keys that were re-cached since
+            if entry is not None and entry[0] == expiry:
+                self.research_cache.pop(key, None)
+
     async def handle_message(self, message: AgentMessage) -> None:
         """Handle incoming messages.
 
@@ -443,13 +494,20 @@ class ResearchAgent(BaseAgent):
             # Process research request
             result = await self.process(message.data)
 
-            # Send response
+            # Send response. The envelope is built by hand: model_dump()
+            # would walk and copy the whole research payload, which is
+            # already a plain dict
             response = AgentMessage(
                 sender=self.name,
                 recipient=message.sender,
                 message_type=MessageType.COMPANY_INTEL,
-                data=result.dict(),
+                data={
+                    'success': result.success,
+                    'result': result.result,
+                    'errors': result.errors,
+                    'metrics': result.metrics
+                },
                 correlation_id=message.correlation_id
             )
 
-            await self.message_bus.send(response)
\ No newline at end of file
+            await self._send(response)
\ No newline at end of file
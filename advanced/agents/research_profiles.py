@@ -0,0 +1,125 @@
+"""Static company, industry and culture profiles used by the research agent."""
+
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Profiles for known companies, matched by name substring in this order.
+# All profile tables are frozen so the shared copies can be returned as-is
+COMPANIES: Mapping[str, Mapping[str, Any]] = _freeze({
+    'airbnb': {
+        'company': 'Airbnb',
+        'industry': 'Travel & Hospitality',
+        'stage': 'Public',
+        'size': '5000+',
+        'mission': 'Create a world where anyone can belong anywhere',
+        'focus_areas': ['Guest experience', 'Host success', 'Global expansion'],
+        'tech_stack': ['React', 'Ruby on Rails', 'AWS', 'Kubernetes'],
+        'recent_initiatives': ['AI-powered search', 'Host passport program', 'Categories expansion']
+    },
+    'etsy': {
+        'company': 'Etsy',
+        'industry': 'E-commerce Marketplace',
+        'stage': 'Public',
+        'size': '2000+',
+        'mission': 'Keep commerce human',
+        'focus_areas': ['Seller empowerment', 'Buyer discovery', 'Sustainable commerce'],
+        'tech_stack': ['PHP', 'React', 'MySQL', 'Google Cloud'],
+        'recent_initiatives': ['AI recommendations', 'Seller tools', 'International expansion']
+    },
+    'stripe': {
+        'company': 'Stripe',
+        'industry': 'FinTech/Payments',
+        'stage': 'Private',
+        'size': '7000+',
+        'mission': 'Increase the GDP of the internet',
+        'focus_areas': ['Developer experience', 'Global payments', 'Platform economy'],
+        'tech_stack': ['Ruby', 'Go', 'JavaScript', 'AWS'],
+        'recent_initiatives': ['Stripe Apps', 'Revenue recognition', 'Climate commitment']
+    }
+})
+
+# Industry context for known industries
+INDUSTRIES: Mapping[str, Mapping[str, Any]] = _freeze({
+    'travel': {
+        'industry': 'Travel & Hospitality',
+        'market_size': '$1.9T global travel market',
+        'growth_rate': '7.5% CAGR',
+        'key_trends': ['Experiential travel', 'Digital nomads', 'Sustainable tourism'],
+        'competitors': ['Booking.com', 'Expedia', 'VRBO'],
+        'challenges': ['Regulation', 'Trust & safety', 'Post-pandemic recovery']
+    },
+    'ecommerce': {
+        'industry': 'E-commerce Marketplace',
+        'market_size': '$5.5T global e-commerce',
+        'growth_rate': '9.7% CAGR',
+        'key_trends': ['Social commerce', 'Creator economy', 'Personalization'],
+        'competitors': ['Amazon Handmade', 'eBay', 'Facebook Marketplace'],
+        'challenges': ['CAC growth', 'Platform differentiation', 'Seller retention']
+    },
+    'fintech': {
+        'industry': 'FinTech/Payments',
+        'market_size': '$8.9T payment processing',
+        'growth_rate': '11.2% CAGR',
+        'key_trends': ['Embedded finance', 'Crypto payments', 'B2B payments'],
+        'competitors': ['Square', 'PayPal', 'Adyen'],
+        'challenges': ['Regulation', 'Fraud prevention', 'Global expansion']
+    }
+})
+
+# Company names that place a company in each industry, checked in order
+INDUSTRY_COMPANIES: Dict[str, Tuple[str, ...]] = {
+    'travel': ('airbnb', 'booking', 'expedia', 'tripadvisor'),
+    'ecommerce': ('etsy', 'ebay', 'amazon', 'shopify'),
+    'fintech': ('stripe', 'square', 'paypal', 'adyen')
+}
+
+DEFAULT_INDUSTRY: Mapping[str, Any] = _freeze({
+    'industry': 'Technology',
+    'market_size': 'Growing',
+    'growth_rate': 'Double-digit',
+    'key_trends': ['AI adoption', 'Digital transformation'],
+    'competitors': ['Various'],
+    'challenges': ['Talent acquisition', 'Innovation pace']
+})
+
+# Culture profiles for known companies, matched by name substring
+CULTURES: Mapping[str, Mapping[str, Any]] = _freeze({
+    'airbnb': {
+        'culture': {
+            'values': ['Belong anywhere', 'Champion the mission', 'Be a host'],
+            'keywords': ['belonging', 'community', 'hospitality', 'global', 'inclusive'],
+            'work_style': 'Flexible, remote-friendly, collaborative',
+            'leadership_style': 'Mission-driven, data-informed, design-thinking',
+            'employee_sentiment': 'Strong mission alignment, focus on impact'
+        }
+    },
+    'etsy': {
+        'culture': {
+            'values': ['Keep commerce human', 'Commitment to craft', 'Sustainable practice'],
+            'keywords': ['human', 'creative', 'sustainable', 'authentic', 'community'],
+            'work_style': 'Creative, autonomous, impact-focused',
+            'leadership_style': 'Empowering, transparent, values-driven',
+            'employee_sentiment': 'Purpose-driven, creative freedom'
+        }
+    }
+})
+
+DEFAULT_CULTURE: Mapping[str, Any] = _freeze({
+    'culture': {
+        'values': ['Innovation', 'Customer focus', 'Excellence'],
+        'keywords': ['collaborative', 'innovative', 'fast-paced', 'data-driven'],
+        'work_style': 'Collaborative and results-oriented',
+        'leadership_style': 'Strategic and empowering',
+        'employee_sentiment': 'Growth-oriented'
+    }
+})
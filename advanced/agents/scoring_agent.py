@@ -1,9 +1,21 @@
 """Scoring agent - consolidates job evaluation and rubric scoring."""
 
+import asyncio
+import copy
+import functools
+import hashlib
+import heapq
 import json
 import re
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, List, Tuple, Optional, Set
+
+try:
+    import ahocorasick
+    ahocorasick_available = True
+except ImportError:
+    ahocorasick_available = False
 
 from agents.base_agent import BaseAgent, AgentResponse
 from utils import get_logger, log_kv
@@ -11,6 +23,96 @@ from core import AgentMessage, MessageType
 
 logger = get_logger("scoring_agent")
 
+# Years of experience asked for, e.g. "5+ years of experience"
+YEARS_EXPERIENCE_RE = re.compile(r'(\d+)\+?\s*years?\s*(?:of\s*)?experience')
+
+# Phrases that signal a people-management requirement, fused into one
+# alternation so the JD is searched once
+MANAGEMENT_RE = re.compile('|'.join((
+    r'manage\s+team',
+    r'lead\s+team',
+    r'manage\s+\d+\+?\s*(?:people|engineers|pms)',
+    r'people\s+management',
+    r'team\s+leadership'
+)))
+
+# Quantified targets such as "20%"
+PERCENT_RE = re.compile(r'\d+%')
+
+# Locations within the 90-minute NYC radius (or not tied to an office),
+# matched anywhere in the location and ignoring case
+COMMUTABLE_LOCATION_RE = re.compile('|'.join(re.escape(term) for term in (
+    'remote', 'hybrid', 'new york', 'ny', 'nyc', '[YOUR_STATE]', 'nj'
+)), re.IGNORECASE)
+
+# JD section headers, in priority order. The first one found anywhere in a
+# short line starts a section named after it ("what you'll do" -> what_youll_do)
+SECTION_HEADERS = (
+    'responsibilities', 'requirements', 'qualifications',
+    'what you\'ll do', 'what we\'re looking for', 'nice to have'
+)
+
+# One match per line names the winning header: each header is a named
+# lookahead anchored at the start, tried in order, so match().lastgroup
+# is the first header with a hit anywhere in the line
+SECTION_HEADER_RE = re.compile(r'\A(?:' + '|'.join(
+    f"(?P<{header.replace(' ', '_').replace(chr(39), '')}>(?=.*?{re.escape(header)}))"
+    for header in SECTION_HEADERS
+) + ')', re.DOTALL)
+
+# Keyword groups looked up (as substrings of the lowercased JD) by the
+# requirement extraction, category scorers, penalties and gates. Groups
+# are sets, tested against the scanned keywords with set operations;
+# technical skills keep their order since they are reported as a list
+TECH_KEYWORDS = ('python', 'sql', 'javascript', 'react', 'aws', 'gcp', 'kubernetes', 'api', 'microservices')
+SENIOR_IC_TITLES = frozenset({'principal', 'staff', 'senior product manager', 'sr. product manager'})
+LEADERSHIP_TITLES = frozenset({'director', 'head', 'vp', 'vice president'})
+LEADERSHIP_KEYWORDS = frozenset({'strategy', 'vision', 'roadmap', 'own', 'drive', 'lead', 'initiative',
+                                 'ship', 'build', 'define', 'collaborate', 'analyze', 'track'})
+METRICS_KEYWORDS = frozenset({'metrics', 'kpi', 'roi', 'growth', 'retention', 'revenue', 'conversion'})
+RESULTS_KEYWORDS = frozenset({'results', 'impact', 'outcomes', 'deliver'})
+OWNERSHIP_KEYWORDS = frozenset({'own', 'drive', 'lead', 'responsible', 'accountable', 'deliver',
+                                'ship', 'launch', 'build', 'define'})
+COLLABORATION_KEYWORDS = frozenset({'collaborate', 'work with', 'partner', 'team', 'cross-functional'})
+IMPACT_KEYWORDS = frozenset({'impact', 'results', 'success', 'growth'})
+EXPERIMENTATION_KEYWORDS = frozenset({'a/b test', 'experiment', 'hypothesis', 'data', 'analytics', 'testing',
+                                      'metrics', 'measure', 'analyze', 'insights'})
+PRODUCT_KEYWORDS = frozenset({'user', 'customer', 'experience', 'discovery', 'validation',
+                              'journey', 'needs', 'feedback', 'research', 'design'})
+XFN_KEYWORDS = frozenset({'cross-functional', 'collaborate', 'partner', 'engineering', 'design', 'sales', 'marketing'})
+# Strong domain matches (direct experience from [CURRENT_COMPANY]/startups)
+STRONG_DOMAINS = frozenset({'marketplace', 'ecommerce', 'e-commerce', 'gifting', 'florist',
+                            'b2b2c', 'grocery', 'delivery', 'social'})
+CONSUMER_KEYWORDS = frozenset({'consumer', 'user', 'customer', 'delight', 'experience', 'engagement'})
+SPECIALIZED_DOMAINS = frozenset({'blockchain', 'crypto', 'medical device', 'pharma', 'defense', 'aerospace'})
+COMMUNICATION_KEYWORDS = frozenset({'communicate', 'communication', 'present', 'stakeholder', 'collaborate',
+                                    'work with', 'partner', 'written', 'verbal', 'team', 'cross-functional'})
+EXECUTIVE_KEYWORDS = frozenset({'board', 'c-suite', 'executive'})
+AI_DELIVERY_KEYWORDS = frozenset({'implement', 'deploy', 'production'})
+TOOL_KEYWORDS = frozenset({'jira', 'confluence', 'slack', 'notion', 'asana'})
+XFN_PENALTY_KEYWORDS = frozenset({'cross-functional', 'collaborate', 'partner'})
+
+# Every keyword above, deduplicated, for the single-pass JD scan
+SCAN_KEYWORDS = frozenset().union(
+    TECH_KEYWORDS, SENIOR_IC_TITLES, LEADERSHIP_TITLES, ('product manager',),
+    LEADERSHIP_KEYWORDS, METRICS_KEYWORDS, RESULTS_KEYWORDS, OWNERSHIP_KEYWORDS,
+    COLLABORATION_KEYWORDS, IMPACT_KEYWORDS, EXPERIMENTATION_KEYWORDS, PRODUCT_KEYWORDS,
+    XFN_KEYWORDS, STRONG_DOMAINS, CONSUMER_KEYWORDS, SPECIALIZED_DOMAINS,
+    COMMUNICATION_KEYWORDS, EXECUTIVE_KEYWORDS, ('ai',), AI_DELIVERY_KEYWORDS,
+    TOOL_KEYWORDS, XFN_PENALTY_KEYWORDS, ('hands-on coding',)
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_rubric(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a scoring rubric file, shared across agent instances.
+
+    Modification time and size are part of the cache key so edits on
+    disk are picked up without restarting the process.
+    """
+    with open(path, 'r') as f:
+        return json.load(f)
+
 
 class ScoringAgent(BaseAgent):
     """Consolidated scoring agent for job evaluation using 100-point rubric."""
@@ -27,6 +129,37 @@ class ScoringAgent(BaseAgent):
         self.rubric = self._load_rubric()
         self.user_profile = self._load_user_profile(config)
 
+        # All keywords, including the rubric's own, are found in one pass
+        # over the JD when pyahocorasick is installed
+        self._scan_keywords = SCAN_KEYWORDS.union(
+            keyword
+            for category in self.rubric.get('categories', [])
+            for keyword in category.get('keywords', [])
+        )
+        self._automaton = self._build_automaton() if config.get('use_ahocorasick', True) else None
+
+        self._category_scorers = {
+            'Role Alignment': self._score_role_alignment,
+            'Outcomes & Metrics': self._score_outcomes,
+            'Scope & Seniority': self._score_scope,
+            'Experimentation': self._score_experimentation,
+            'Product Sense': self._score_product_sense,
+            'Cross-functional': self._score_cross_functional,
+            'Domain/Technical': self._score_domain_technical,
+            'Communication': self._score_communication,
+            'Company Fit': self._score_company_fit,
+            'Evidence Depth': self._score_evidence_depth
+        }
+
+        # Results keyed by digests of everything scoring reads; reruns and
+        # retries of the same posting skip the whole pipeline
+        self.result_cache_size = config.get('result_cache_size', 256)
+        self._result_cache: "OrderedDict[Tuple[bytes, bytes, bytes], Dict[str, Any]]" = OrderedDict()
+
+        # Long JDs are scored in a worker thread so keyword scanning doesn't
+        # stall the event loop; short ones are faster to score inline
+        self.offload_min_chars = config.get('offload_min_chars', 5000)
+
         logger.info(f"Loaded rubric with {len(self.rubric.get('categories', []))} categories")
 
     def _load_rubric(self) -> Dict[str, Any]:
@@ -38,8 +171,8 @@ class ScoringAgent(BaseAgent):
             return self._get_default_rubric()
 
         try:
-            with open(rubric_file, 'r') as f:
-                return json.load(f)
+            stat = rubric_file.stat()
+            return _read_rubric(str(rubric_file.resolve()), stat.st_mtime_ns, stat.st_size)
         except Exception as e:
             logger.error(f"Failed to load rubric: {e}")
             return self._get_default_rubric()
@@ -82,61 +215,37 @@ class ScoringAgent(BaseAgent):
                 company=job_data.get('company'),
                 role=job_data.get('role'))
 
-            # Extract requirements from JD
-            requirements = self._extract_requirements(jd_text)
-
-            # Score each category
-            category_scores = {}
-            total_score = 0
-
-            for category in self.rubric.get('categories', []):
-                score = self._score_category(
-                    category=category,
-                    jd_text=jd_text,
-                    requirements=requirements,
-                    research_data=research_data
-                )
-                category_scores[category['name']] = score
-                total_score += score
-
-            # Apply penalties
-            penalties = self._calculate_penalties(jd_text, requirements)
-            total_score -= sum(penalties.values())
-
-            # Check gate conditions
-            gate_failures = self._check_gates(job_data, requirements)
-
-            # Generate recommendation
-            recommendation = self._get_recommendation(total_score, gate_failures)
-
-            # Identify top gaps
-            top_gaps = self._identify_gaps(category_scores)
-
-            # Build scoring result
-            scoring_result = {
-                'total_score': max(0, min(100, total_score)),  # Clamp to 0-100
-                'category_breakdown': category_scores,
-                'penalties': penalties,
-                'gate_failures': gate_failures,
-                'recommendation': recommendation,
-                'top_gaps': top_gaps,
-                'confidence': self._calculate_confidence(category_scores, requirements)
-            }
+            key = self._cache_key(job_data, research_data)
+            cached = self._result_cache.get(key)
+
+            if cached is not None:
+                self._result_cache.move_to_end(key)
+                scoring_result = copy.deepcopy(cached)
+                logger.info("Scoring result served from cache")
+            else:
+                if len(jd_text) >= self.offload_min_chars:
+                    scoring_result = await asyncio.to_thread(self._score, job_data, research_data, jd_text)
+                else:
+                    scoring_result = self._score(job_data, research_data, jd_text)
+                if self.result_cache_size > 0:
+                    self._result_cache[key] = copy.deepcopy(scoring_result)
+                    while len(self._result_cache) > self.result_cache_size:
+                        self._result_cache.popitem(last=False)
 
             # Log result
             log_kv(logger, "scoring_complete",
                 total_score=scoring_result['total_score'],
-                recommendation=recommendation,
-                gate_failures=len(gate_failures))
+                recommendation=scoring_result['recommendation'],
+                gate_failures=len(scoring_result['gate_failures']))
 
             return AgentResponse(
                 success=True,
                 result=scoring_result,
                 metrics={
                     'total_score': scoring_result['total_score'],
-                    'categories_scored': len(category_scores),
-                    'penalties_applied': len(penalties),
-                    'gates_passed': len(gate_failures) == 0
+                    'categories_scored': len(scoring_result['category_breakdown']),
+                    'penalties_applied': len(scoring_result['penalties']),
+                    'gates_passed': len(scoring_result['gate_failures']) == 0
                 }
             )
 
@@ -147,11 +256,115 @@ class ScoringAgent(BaseAgent):
                 errors=[str(e)]
             )
 
-    def _extract_requirements(self, jd_text: str) -> Dict[str, Any]:
+    def _cache_key(self, job_data: Dict[str, Any], research_data: Dict[str, Any]) -> Tuple[bytes, bytes, bytes]:
+        """Build the result cache key from the JD, gate inputs and research digests."""
+        jd_digest = hashlib.blake2b(job_data.get('description', '').encode('utf-8'), digest_size=16).digest()
+        gate_digest = hashlib.blake2b(
+            json.dumps([job_data.get('location', ''), job_data.get('compensation', {})],
+                       sort_keys=True, default=str).encode('utf-8'),
+            digest_size=16
+        ).digest()
+        research_digest = hashlib.blake2b(
+            json.dumps(research_data, sort_keys=True, default=str).encode('utf-8'), digest_size=16
+        ).digest()
+        return jd_digest, gate_digest, research_digest
+
+    def _score(self, job_data: Dict[str, Any], research_data: Dict[str, Any], jd_text: str) -> Dict[str, Any]:
+        """Score a job against the rubric.
+
+        Args:
+            job_data: Job information
+            research_data: Company research
+            jd_text: Job description text
+
+        Returns:
+            Scoring result
+        """
+        # Lowercase the JD and find every known keyword in it once, up front
+        jd_lower = jd_text.lower()
+        found = self._find_keywords(jd_lower)
+
+        # Extract requirements from JD
+        requirements = self._extract_requirements(jd_text, jd_lower, found)
+
+        # Score each category
+        category_scores = {}
+        total_score = 0
+
+        for category in self.rubric.get('categories', []):
+            score = self._score_category(
+                category=category,
+                jd_text=jd_text,
+                found=found,
+                requirements=requirements,
+                research_data=research_data
+            )
+            category_scores[category['name']] = score
+            total_score += score
+
+        # Apply penalties
+        penalties = self._calculate_penalties(found, requirements)
+        total_score -= sum(penalties.values())
+
+        # Check gate conditions
+        gate_failures = self._check_gates(job_data, requirements, found)
+
+        # Generate recommendation
+        recommendation = self._get_recommendation(total_score, gate_failures)
+
+        # Identify top gaps
+        top_gaps = self._identify_gaps(category_scores)
+
+        # Build scoring result
+        return {
+            'total_score': max(0, min(100, total_score)),  # Clamp to 0-100
+            'category_breakdown': category_scores,
+            'penalties': penalties,
+            'gate_failures': gate_failures,
+            'recommendation': recommendation,
+            'top_gaps': top_gaps,
+            'confidence': self._calculate_confidence(category_scores, requirements)
+        }
+
+    def _build_automaton(self) -> Optional[Any]:
+        """Build an Aho-Corasick automaton over every scanned keyword.
+
+        Returns:
+            Automaton, or None to fall back to substring checks
+        """
+        if not ahocorasick_available:
+            return None
+
+        try:
+            automaton = ahocorasick.Automaton()
+            for keyword in self._scan_keywords:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            return automaton
+        except Exception as e:
+            logger.warning("Keyword automaton build failed, using substring checks: %s", e)
+            return None
+
+    def _find_keywords(self, jd_lower: str) -> Set[str]:
+        """Find which scanned keywords occur anywhere in the lowercased JD.
+
+        Args:
+            jd_lower: Lowercased job description text
+
+        Returns:
+            Keywords present in the JD
+        """
+        if self._automaton is not None:
+            return {keyword for _, keyword in self._automaton.iter(jd_lower)}
+        return {keyword for keyword in self._scan_keywords if keyword in jd_lower}
+
+    def _extract_requirements(self, jd_text: str, jd_lower: str, found: Set[str]) -> Dict[str, Any]:
         """Extract requirements from job description.
 
         Args:
             jd_text: Job description text
+            jd_lower: Lowercased job description text
+            found: Keywords present in the JD
 
         Returns:
             Extracted requirements
@@ -166,32 +379,18 @@ class ScoringAgent(BaseAgent):
         }
 
         # Extract years of experience
-        years_pattern = r'(\d+)\+?\s*years?\s*(?:of\s*)?experience'
-        years_match = re.search(years_pattern, jd_text.lower())
+        years_match = YEARS_EXPERIENCE_RE.search(jd_lower)
         if years_match:
             requirements['years_required'] = int(years_match.group(1))
 
         # Check for management requirements
-        management_patterns = [
-            r'manage\s+team',
-            r'lead\s+team',
-            r'manage\s+\d+\+?\s*(?:people|engineers|pms)',
-            r'people\s+management',
-            r'team\s+leadership'
-        ]
-        for pattern in management_patterns:
-            if re.search(pattern, jd_text.lower()):
-                requirements['management_required'] = True
-                break
+        requirements['management_required'] = bool(MANAGEMENT_RE.search(jd_lower))
 
         # Extract technical skills
-        tech_keywords = ['python', 'sql', 'javascript', 'react', 'aws', 'gcp', 'kubernetes', 'api', 'microservices']
-        for keyword in tech_keywords:
-            if keyword in jd_text.lower():
-                requirements['technical_skills'].append(keyword)
+        requirements['technical_skills'] = [keyword for keyword in TECH_KEYWORDS if keyword in found]
 
         # Extract sections
-        sections = self._extract_sections(jd_text)
+        sections = self._extract_sections(jd_text, jd_lower)
         if 'responsibilities' in sections:
             requirements['responsibilities'] = sections['responsibilities']
         if 'requirements' in sections:
@@ -199,36 +398,37 @@ class ScoringAgent(BaseAgent):
 
         return requirements
 
-    def _extract_sections(self, jd_text: str) -> Dict[str, List[str]]:
-        """Extract sections from job description."""
+    def _extract_sections(self, jd_text: str, jd_lower: str) -> Dict[str, List[str]]:
+        """Extract sections from job description.
+
+        Lowercasing never adds or removes newlines, so the lines of the
+        already-lowercased JD pair up with the original lines.
+        """
         sections = {}
         current_section = None
-        lines = jd_text.split('\n')
-
-        section_headers = [
-            'responsibilities', 'requirements', 'qualifications',
-            'what you\'ll do', 'what we\'re looking for', 'nice to have'
-        ]
 
-        for line in lines:
-            line_lower = line.lower().strip()
+        for line, line_lower in zip(jd_text.split('\n'), jd_lower.split('\n')):
+            line_lower = line_lower.strip()
 
-            # Check if this is a section header
-            for header in section_headers:
-                if header in line_lower and len(line) < 100:
-                    current_section = header.replace(' ', '_').replace('\'', '')
+            # Check if this is a section header (only short lines qualify)
+            if len(line) < 100:
+                header = SECTION_HEADER_RE.match(line_lower)
+                if header:
+                    current_section = header.lastgroup
                     sections[current_section] = []
-                    break
 
             # Add content to current section
-            if current_section and line.strip() and line.strip() != line_lower:
-                sections[current_section].append(line.strip())
+            if current_section:
+                stripped = line.strip()
+                if stripped and stripped != line_lower:
+                    sections[current_section].append(stripped)
 
         return sections
 
     def _score_category(self,
                        category: Dict[str, Any],
                        jd_text: str,
+                       found: Set[str],
                        requirements: Dict[str, Any],
                        research_data: Dict[str, Any]) -> float:
         """Score a single category.
@@ -236,93 +436,80 @@ class ScoringAgent(BaseAgent):
         Args:
             category: Category configuration
             jd_text: Job description text
+            found: Keywords present in the JD
             requirements: Extracted requirements
             research_data: Company research
 
         Returns:
             Category score
         """
-        category_name = category['name']
         weight = category['weight']
-        keywords = category.get('keywords', [])
-
-        # Count keyword matches
-        keyword_matches = sum(1 for kw in keywords if kw in jd_text.lower())
-        keyword_ratio = keyword_matches / len(keywords) if keywords else 0
-
-        # Category-specific scoring logic
-        if category_name == 'Role Alignment':
-            score = self._score_role_alignment(jd_text, requirements)
-        elif category_name == 'Outcomes & Metrics':
-            score = self._score_outcomes(jd_text)
-        elif category_name == 'Scope & Seniority':
-            score = self._score_scope(jd_text, requirements)
-        elif category_name == 'Experimentation':
-            score = self._score_experimentation(jd_text)
-        elif category_name == 'Product Sense':
-            score = self._score_product_sense(jd_text)
-        elif category_name == 'Cross-functional':
-            score = self._score_cross_functional(jd_text)
-        elif category_name == 'Domain/Technical':
-            score = self._score_domain_technical(jd_text, requirements, research_data)
-        elif category_name == 'Communication':
-            score = self._score_communication(jd_text)
-        elif category_name == 'Company Fit':
-            score = self._score_company_fit(research_data)
-        elif category_name == 'Evidence Depth':
-            score = 2.5  # Default to middle score
+
+        # Category-specific scoring logic, else partial credit for keywords
+        scorer = self._category_scorers.get(category['name'])
+        if scorer is not None:
+            score = scorer(jd_text, found, requirements, research_data)
         else:
+            keywords = category.get('keywords', [])
+            keyword_matches = sum(1 for kw in keywords if kw in found)
+            keyword_ratio = keyword_matches / len(keywords) if keywords else 0
             score = keyword_ratio * weight * 0.5
 
         # Apply weight and cap at category maximum
         return min(score, weight)
 
-    def _score_role_alignment(self, jd_text: str, requirements: Dict[str, Any]) -> float:
+    def _score_role_alignment(self,
+                              jd_text: str,
+                              found: Set[str],
+                              requirements: Dict[str, Any],
+                              research_data: Dict[str, Any]) -> float:
         """Score role alignment (15 points max)."""
-        jd_lower = jd_text.lower()
         score = 0
 
         # Check title alignment - very inclusive scoring
-        if any(term in jd_lower for term in ['principal', 'staff', 'senior product manager', 'sr. product manager']):
+        if not found.isdisjoint(SENIOR_IC_TITLES):
             score += 8  # Great match
-        elif any(term in jd_lower for term in ['director', 'head', 'vp', 'vice president']):
+        elif not found.isdisjoint(LEADERSHIP_TITLES):
             score += 7  # Also great
-        elif 'product manager' in jd_lower:
+        elif 'product manager' in found:
             score += 7  # Standard PM roles are perfectly valid targets
         else:
             score += 3
 
         # Check leadership/ownership keywords - broader set
-        leadership_keywords = ['strategy', 'vision', 'roadmap', 'own', 'drive', 'lead', 'initiative',
-                              'ship', 'build', 'define', 'collaborate', 'analyze', 'track']
-        keyword_count = sum(1 for kw in leadership_keywords if kw in jd_lower)
+        keyword_count = len(found & LEADERSHIP_KEYWORDS)
         score += min(keyword_count * 2, 8)  # More generous scoring
 
         return min(score, 15)
 
-    def _score_outcomes(self, jd_text: str) -> float:
+    def _score_outcomes(self,
+                        jd_text: str,
+                        found: Set[str],
+                        requirements: Dict[str, Any],
+                        research_data: Dict[str, Any]) -> float:
         """Score outcomes & metrics focus (15 points max)."""
-        jd_lower = jd_text.lower()
         score = 0
 
         # Check for metrics keywords
-        metrics_keywords = ['metrics', 'kpi', 'roi', 'growth', 'retention', 'revenue', 'conversion']
-        if any(kw in jd_lower for kw in metrics_keywords):
+        if not found.isdisjoint(METRICS_KEYWORDS):
             score += 7
 
         # Check for quantified requirements
-        if re.search(r'\d+%', jd_text):
+        if PERCENT_RE.search(jd_text):
             score += 4
 
         # Check for results orientation
-        if any(term in jd_lower for term in ['results', 'impact', 'outcomes', 'deliver']):
+        if not found.isdisjoint(RESULTS_KEYWORDS):
             score += 4
 
         return min(score, 15)
 
-    def _score_scope(self, jd_text: str, requirements: Dict[str, Any]) -> float:
+    def _score_scope(self,
+                     jd_text: str,
+                     found: Set[str],
+                     requirements: Dict[str, Any],
+                     research_data: Dict[str, Any]) -> float:
         """Score scope & seniority (12 points max)."""
-        jd_lower = jd_text.lower()
         score = 5  # Base score for any PM role (they all have scope)
 
         # Management is a plus but not required
@@ -330,101 +517,103 @@ class ScoringAgent(BaseAgent):
             score += 2
 
         # Any ownership language gets credit
-        ownership_keywords = ['own', 'drive', 'lead', 'responsible', 'accountable', 'deliver',
-                             'ship', 'launch', 'build', 'define']
-        if any(kw in jd_lower for kw in ownership_keywords):
+        if not found.isdisjoint(OWNERSHIP_KEYWORDS):
             score += 3
 
         # Check for team collaboration (almost always present)
-        if any(term in jd_lower for term in ['collaborate', 'work with', 'partner', 'team', 'cross-functional']):
+        if not found.isdisjoint(COLLABORATION_KEYWORDS):
             score += 3
 
         # Any mention of impact
-        if any(term in jd_lower for term in ['impact', 'results', 'success', 'growth']):
+        if not found.isdisjoint(IMPACT_KEYWORDS):
             score += 2
 
         return min(score, 12)
 
-    def _score_experimentation(self, jd_text: str) -> float:
+    def _score_experimentation(self,
+                               jd_text: str,
+                               found: Set[str],
+                               requirements: Dict[str, Any],
+                               research_data: Dict[str, Any]) -> float:
         """Score experimentation focus (10 points max)."""
-        jd_lower = jd_text.lower()
         score = 3  # Base score - we have data-driven experience
 
-        exp_keywords = ['a/b test', 'experiment', 'hypothesis', 'data', 'analytics', 'testing',
-                       'metrics', 'measure', 'analyze', 'insights']
-        keyword_count = sum(1 for kw in exp_keywords if kw in jd_lower)
+        keyword_count = len(found & EXPERIMENTATION_KEYWORDS)
         score += keyword_count * 1.5
 
         return min(score, 10)
 
-    def _score_product_sense(self, jd_text: str) -> float:
+    def _score_product_sense(self,
+                             jd_text: str,
+                             found: Set[str],
+                             requirements: Dict[str, Any],
+                             research_data: Dict[str, Any]) -> float:
         """Score product sense requirements (8 points max)."""
-        jd_lower = jd_text.lower()
         score = 3  # Base score - we have product sense from Senior PM role
 
-        product_keywords = ['user', 'customer', 'experience', 'discovery', 'validation',
-                          'journey', 'needs', 'feedback', 'research', 'design']
-        keyword_count = sum(1 for kw in product_keywords if kw in jd_lower)
+        keyword_count = len(found & PRODUCT_KEYWORDS)
         score += keyword_count
 
         return min(score, 8)
 
-    def _score_cross_functional(self, jd_text: str) -> float:
+    def _score_cross_functional(self,
+                                jd_text: str,
+                                found: Set[str],
+                                requirements: Dict[str, Any],
+                                research_data: Dict[str, Any]) -> float:
         """Score cross-functional requirements (10 points max)."""
-        jd_lower = jd_text.lower()
-        score = 0
-
-        xfn_keywords = ['cross-functional', 'collaborate', 'partner', 'engineering', 'design', 'sales', 'marketing']
-        keyword_count = sum(1 for kw in xfn_keywords if kw in jd_lower)
+        keyword_count = len(found & XFN_KEYWORDS)
         score = keyword_count * 2
 
         return min(score, 10)
 
     def _score_domain_technical(self,
                                jd_text: str,
+                               found: Set[str],
                                requirements: Dict[str, Any],
                                research_data: Dict[str, Any]) -> float:
         """Score domain/technical fit (10 points max)."""
-        jd_lower = jd_text.lower()
         industry_lower = research_data.get('industry', '').lower()
         score = 4  # Base score - most PM roles are transferable
 
-        # Strong domain matches (direct experience from [CURRENT_COMPANY]/startups)
-        strong_domains = ['marketplace', 'ecommerce', 'e-commerce', 'gifting', 'florist',
-                         'b2b2c', 'grocery', 'delivery', 'social']
-        if any(domain in industry_lower or domain in jd_lower for domain in strong_domains):
+        # Strong domain matches, in the JD or the company's industry
+        if (not found.isdisjoint(STRONG_DOMAINS) or
+                any(domain in industry_lower for domain in STRONG_DOMAINS)):
             score += 3
 
         # Consumer product experience is highly relevant
-        consumer_keywords = ['consumer', 'user', 'customer', 'delight', 'experience', 'engagement']
-        if any(kw in jd_lower for kw in consumer_keywords):
+        if not found.isdisjoint(CONSUMER_KEYWORDS):
             score += 2
 
         # Any product without deep specialization is fine
-        no_specialization = not any(term in jd_lower for term in ['blockchain', 'crypto', 'medical device',
-                                                                   'pharma', 'defense', 'aerospace'])
+        no_specialization = found.isdisjoint(SPECIALIZED_DOMAINS)
         if no_specialization:
             score += 1
 
         return min(score, 10)
 
-    def _score_communication(self, jd_text: str) -> float:
+    def _score_communication(self,
+                             jd_text: str,
+                             found: Set[str],
+                             requirements: Dict[str, Any],
+                             research_data: Dict[str, Any]) -> float:
         """Score communication requirements (8 points max)."""
-        jd_lower = jd_text.lower()
         score = 3  # Base score - all PMs need communication skills
 
-        comm_keywords = ['communicate', 'communication', 'present', 'stakeholder', 'collaborate',
-                        'work with', 'partner', 'written', 'verbal', 'team', 'cross-functional']
-        keyword_count = sum(1 for kw in comm_keywords if kw in jd_lower)
+        keyword_count = len(found & COMMUNICATION_KEYWORDS)
         score += keyword_count
 
         # Bonus for executive communication
-        if any(term in jd_lower for term in ['board', 'c-suite', 'executive']):
+        if not found.isdisjoint(EXECUTIVE_KEYWORDS):
             score += 1
 
         return min(score, 8)
 
-    def _score_company_fit(self, research_data: Dict[str, Any]) -> float:
+    def _score_company_fit(self,
+                           jd_text: str,
+                           found: Set[str],
+                           requirements: Dict[str, Any],
+                           research_data: Dict[str, Any]) -> float:
         """Score company fit (7 points max)."""
         # More generous base score - we can adapt to most companies
         score = 4
@@ -437,11 +626,19 @@ class ScoringAgent(BaseAgent):
 
         return min(score, 7)
 
-    def _calculate_penalties(self, jd_text: str, requirements: Dict[str, Any]) -> Dict[str, int]:
+    def _score_evidence_depth(self,
+                              jd_text: str,
+                              found: Set[str],
+                              requirements: Dict[str, Any],
+                              research_data: Dict[str, Any]) -> float:
+        """Score evidence depth (5 points max)."""
+        return 2.5  # Default to middle score
+
+    def _calculate_penalties(self, found: Set[str], requirements: Dict[str, Any]) -> Dict[str, int]:
         """Calculate penalties based on rubric rules.
 
         Args:
-            jd_text: Job description text
+            found: Keywords present in the JD
             requirements: Extracted requirements
 
         Returns:
@@ -450,26 +647,30 @@ class ScoringAgent(BaseAgent):
         penalties = {}
 
         # Check for vague AI claims
-        if 'ai' in jd_text.lower() and not any(term in jd_text.lower() for term in ['implement', 'deploy', 'production']):
+        if 'ai' in found and found.isdisjoint(AI_DELIVERY_KEYWORDS):
             penalties['vague_ai'] = 5
 
         # Check for tool soup
-        tool_count = sum(1 for tool in ['jira', 'confluence', 'slack', 'notion', 'asana'] if tool in jd_text.lower())
+        tool_count = len(found & TOOL_KEYWORDS)
         if tool_count > 3:
             penalties['tool_soup'] = 5
 
         # Check for lack of cross-functional
-        if not any(term in jd_text.lower() for term in ['cross-functional', 'collaborate', 'partner']):
+        if found.isdisjoint(XFN_PENALTY_KEYWORDS):
             penalties['no_cross_functional'] = 7
 
         return penalties
 
-    def _check_gates(self, job_data: Dict[str, Any], requirements: Dict[str, Any]) -> List[str]:
+    def _check_gates(self,
+                     job_data: Dict[str, Any],
+                     requirements: Dict[str, Any],
+                     found: Set[str]) -> List[str]:
         """Check gate conditions that would disqualify the application.
 
         Args:
             job_data: Job information
             requirements: Extracted requirements
+            found: Keywords present in the job description
 
         Returns:
             List of gate failures
@@ -477,8 +678,8 @@ class ScoringAgent(BaseAgent):
         failures = []
 
         # Location check
-        location = job_data.get('location', '').lower()
-        if location and not any(term in location for term in ['remote', 'hybrid', 'new york', 'ny', 'nyc', '[YOUR_STATE]', 'nj']):
+        location = job_data.get('location', '')
+        if location and not COMMUTABLE_LOCATION_RE.search(location):
             failures.append('Location outside 90-minute NYC radius')
 
         # Compensation check (if available)
@@ -487,7 +688,7 @@ class ScoringAgent(BaseAgent):
             failures.append('Compensation below target range')
 
         # Skills gap check
-        if 'hands-on coding' in job_data.get('description', '').lower():
+        if 'hands-on coding' in found:
             failures.append('Requires hands-on coding')
 
         return failures
@@ -540,9 +741,8 @@ class ScoringAgent(BaseAgent):
                     'gap': weight - score
                 })
 
-        # Sort by gap size and return top 3
-        gaps.sort(key=lambda x: x['gap'], reverse=True)
-        return gaps[:3]
+        # Top 3 by gap size (ties keep rubric order, as a stable sort would)
+        return heapq.nlargest(3, gaps, key=lambda x: x['gap'])
 
     def _calculate_confidence(self,
                              category_scores: Dict[str, float],
@@ -569,7 +769,8 @@ class ScoringAgent(BaseAgent):
         # Higher confidence if scoring is consistent
         scores = list(category_scores.values())
         if scores:
-            variance = sum((s - sum(scores)/len(scores))**2 for s in scores) / len(scores)
+            mean = sum(scores) / len(scores)
+            variance = sum((s - mean)**2 for s in scores) / len(scores)
             if variance < 10:
                 confidence += 0.2
 
@@ -611,8 +812,8 @@ class ScoringAgent(BaseAgent):
                 sender=self.name,
                 recipient=message.sender,
                 message_type=MessageType.SCORING_RESULT,
-                data=result.dict(),
+                data=result.model_dump(),
                 correlation_id=message.correlation_id
             )
 
-            await self.message_bus.send(response)
\ No newline at end of file
+            await self._send(response)
\ No newline at end of file
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Regression checks for the content guardrails applied to generated text."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from agents.content_agent import ContentAgent
+
+# (generated text, expected text after guardrails)
+CASES = [
+    # Words after "At [CURRENT_COMPANY], I" are left alone
+    ("At [CURRENT_COMPANY], I successfully launched", "At [CURRENT_COMPANY], I successfully launched"),
+    ("At [CURRENT_COMPANY], I also rebuilt", "At [CURRENT_COMPANY], I also rebuilt"),
+    ("At [CURRENT_COMPANY], I have grown", "At [CURRENT_COMPANY], I have grown"),
+    # Present-tense phrasing for the current role
+    ("I am currently leading growth", "I recently leading growth"),
+    ("In my current role", "At [CURRENT_COMPANY], I"),
+    ("I continue to ship", "I successfully ship"),
+    # Forbidden phrases
+    ("I am passionate about search", "I am ready to search"),
+    ("Excited to join; seeking impact", "Excited to join; ready to impact"),
+    # Metric corrections
+    ("Served 100M requests", "Served [X,XXX]+ daily volume per week"),
+    ("Led 15+ engineers at [CURRENT_COMPANY]", "Led 10+ cross-functional team members"),
+]
+
+
+async def test_guardrails():
+    """Check each guardrail rewrite."""
+
+    content_agent = ContentAgent({})
+
+    print("Testing Content Guardrails")
+    print("=" * 50)
+
+    for content, expected in CASES:
+        guarded = content_agent._apply_guardrails(content, "resume")
+        print(f"{content!r} -> {guarded!r}")
+        assert guarded == expected, (content, guarded, expected)
+
+    print("\nAll guardrail cases passed")
+
+
+if __name__ == "__main__":
+    asyncio.run(test_guardrails())
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Regression checks for the LLM response cache."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from agents.content_agent import ContentAgent
+from utils.llm_cache import LLMCache, cosine_similarity, make_cache_key
+
+JOB = {'company': 'Airbnb', 'role': 'Senior PM', 'description': 'Own the search experience'}
+BLEND = {'mo_gawdat': 50, 'john_mulaney': 30, 'bill_maher': 20}
+
+
+def _stream(calls: list, text: str):
+    """Stream factory that records each LLM call."""
+    async def chunks():
+        calls.append(text)
+        yield text
+
+    return chunks
+
+
+async def test_exact_cache():
+    """Exact hits, misses and LRU eviction."""
+
+    print("Testing Exact Cache")
+    print("=" * 50)
+
+    # Key order doesn't matter
+    assert make_cache_key({'a': 1, 'b': [1, 2]}) == make_cache_key({'b': [1, 2], 'a': 1})
+    assert make_cache_key({'a': 1}) != make_cache_key({'a': 2})
+
+    cache = LLMCache(max_entries=2)
+    assert await cache.get('a') is None
+    await cache.set('a', 'A')
+    await cache.set('b', 'B')
+    assert await cache.get('a') == 'A'
+
+    # 'b' is now least recently used
+    await cache.set('c', 'C')
+    print(f"Entries: {len(cache)}, hits: {cache.hits}, misses: {cache.misses}")
+    assert len(cache) == 2
+    assert await cache.get('b') is None
+    assert await cache.get('a') == 'A' and await cache.get('c') == 'C'
+    assert (cache.hits, cache.misses) == (3, 2)
+
+    cache.clear()
+    assert len(cache) == 0
+
+    print("\nAll exact cache cases passed")
+
+
+async def test_semantic_cache():
+    """Similar embeddings hit only within their scope and above the threshold."""
+
+    print("Testing Semantic Cache")
+    print("=" * 50)
+
+    assert cosine_similarity([0.0, 0.0], [1.0, 0.0]) == 0.0
+    assert abs(cosine_similarity([1.0, 0.0], [2.0, 0.0]) - 1.0) < 1e-9
+
+    cache = LLMCache(similarity_threshold=0.9)
+    await cache.set('k1', 'near', scope='s1', embedding=[1.0, 0.1])
+    await cache.set('k2', 'far', scope='s1', embedding=[0.0, 1.0])
+    await cache.set('k3', 'other', scope='s2', embedding=[1.0, 0.0])
+    await cache.set('k4', 'plain')
+
+    assert await cache.get_similar('s1', [1.0, 0.0]) == 'near'
+    assert await cache.get_similar('s2', [1.0, 0.0]) == 'other'
+    # Below the threshold in every scope
+    assert await cache.get_similar('s1', [1.0, 1.0]) is None
+    assert await cache.get_similar('s3', [1.0, 0.0]) is None
+
+    print("\nAll semantic cache cases passed")
+
+
+async def test_content_agent_cache():
+    """Reruns of the same job hit the cache; fallbacks are never cached."""
+
+    content_agent = ContentAgent({})
+    calls = []
+
+    print("Testing Content Agent Cache")
+    print("=" * 50)
+
+    first = await content_agent._generate_with_cache(
+        'resume', dict(JOB, job_id='run-1'), 'growth', BLEND, _stream(calls, "Resume one")
+    )
+    # A new job_id alone doesn't defeat the cache
+    second = await content_agent._generate_with_cache(
+        'resume', dict(JOB, job_id='run-2'), 'growth', BLEND, _stream(calls, "Resume two")
+    )
+    assert first == second and len(calls) == 1, (first, second, calls)
+
+    # Anything that reaches the prompt does
+    await content_agent._generate_with_cache(
+        'resume', JOB, 'platform', BLEND, _stream(calls, "Resume three")
+    )
+    await content_agent._generate_with_cache(
+        'cover_letter', JOB, 'growth', BLEND, _stream(calls, "Letter")
+    )
+    assert len(calls) == 3, calls
+
+    # Canned fallback responses are regenerated every time
+    fallback = content_agent.llm_client._get_fallback_resume()
+    other_job = dict(JOB, company='Stripe')
+    for _ in range(2):
+        await content_agent._generate_with_cache(
+            'resume', other_job, 'growth', BLEND, _stream(calls, fallback)
+        )
+    print(f"LLM calls: {len(calls)}, cached entries: {len(content_agent.llm_cache)}")
+    assert len(calls) == 5, len(calls)
+    assert len(content_agent.llm_cache) == 3
+
+    # Disabled cache always calls the LLM
+    uncached_agent = ContentAgent({'llm_cache': False})
+    calls.clear()
+    for _ in range(2):
+        await uncached_agent._generate_with_cache('resume', JOB, 'growth', BLEND, _stream(calls, "Resume"))
+    assert len(calls) == 2
+
+    print("\nAll content agent cache cases passed")
+
+
+if __name__ == "__main__":
+    asyncio.run(test_exact_cache())
+    asyncio.run(test_semantic_cache())
+    asyncio.run(test_content_agent_cache())
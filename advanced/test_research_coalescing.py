@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Regression checks for coalescing concurrent identical research requests."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from agents.research_agent import ResearchAgent
+
+
+def _slow_news(agent: ResearchAgent, calls: list):
+    """Make the news search slow enough for requests to overlap."""
+    original = agent._search_recent_news
+
+    async def slow(company):
+        calls.append(company)
+        await asyncio.sleep(0.05)
+        return await original(company)
+
+    agent._search_recent_news = slow
+
+
+async def test_coalescing():
+    """Identical concurrent requests share one research run."""
+
+    agent = ResearchAgent({})
+    calls = []
+    _slow_news(agent, calls)
+
+    request = {'job_data': {'company': 'Airbnb', 'role': 'Senior PM'}}
+    responses = await asyncio.gather(*[agent.process(request) for _ in range(5)])
+
+    print(f"News searches: {len(calls)}, coalesced: {[r.metrics.get('coalesced', False) for r in responses]}")
+    assert len(calls) == 1, calls
+    assert all(r.success and r.result == responses[0].result for r in responses)
+    assert not agent._inflight
+
+
+async def test_leader_cancellation():
+    """Cancelling the leading request doesn't cancel requests that joined it."""
+
+    agent = ResearchAgent({})
+    calls = []
+    _slow_news(agent, calls)
+
+    request = {'job_data': {'company': 'Stripe', 'role': 'PM'}}
+    leader = asyncio.create_task(agent.process(request))
+    await asyncio.sleep(0)
+    joiners = [asyncio.create_task(agent.process(request)) for _ in range(3)]
+    await asyncio.sleep(0.01)
+
+    leader.cancel()
+    responses = await asyncio.gather(*joiners)
+
+    print(f"Leader cancelled: {leader.cancelled()}, joiners succeeded: {[r.success for r in responses]}")
+    assert leader.cancelled()
+    assert all(r.success for r in responses), responses
+    # One joiner re-ran the research; the others joined it
+    assert len(calls) == 2, calls
+    assert not agent._inflight
+
+
+if __name__ == "__main__":
+    asyncio.run(test_coalescing())
+    asyncio.run(test_leader_cancellation())
+    print("\nAll coalescing cases passed")
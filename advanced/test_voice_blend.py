@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Regression checks for voice blend normalization."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from agents.content_agent import ContentAgent
+from agents.positioning_agent import PositioningAgent
+
+# (strategy, culture keywords, expected blend)
+POSITIONING_CASES = [
+    # Blends that already total 100 are kept as-is
+    ({}, [], {'mo_gawdat': 50, 'john_mulaney': 30, 'bill_maher': 20}),
+    ({}, ['collaborative'], {'mo_gawdat': 60, 'john_mulaney': 30, 'bill_maher': 10}),
+    # 45/30/30 used to truncate to 42/28/28 (98); leftover points go to the
+    # largest remainders, earlier voices winning ties
+    ({}, ['fast-paced'], {'mo_gawdat': 43, 'john_mulaney': 29, 'bill_maher': 28}),
+    # 40/45/20 used to truncate to 38/42/19 (99)
+    ({}, ['technical'], {'mo_gawdat': 38, 'john_mulaney': 43, 'bill_maher': 19}),
+    ({'voice_blend': {'a': 1, 'b': 1, 'c': 1}}, [], {'a': 34, 'b': 33, 'c': 33}),
+]
+
+# (positioning strategy, seeking a role, expected blend)
+CONTENT_CASES = [
+    ({}, False, {'mo_gawdat': 50, 'john_mulaney': 30, 'bill_maher': 20}),
+    # Job search status shifts 5 points from Mo Gawdat to Bill Maher
+    ({}, True, {'mo_gawdat': 45, 'john_mulaney': 30, 'bill_maher': 25}),
+    # Same largest-remainder rounding as positioning (used to be 33/33/33)
+    ({'voice_blend': {'a': 1, 'b': 1, 'c': 1}}, False, {'a': 34, 'b': 33, 'c': 33}),
+    # Used to be 42/28/28
+    ({'voice_blend': {'mo_gawdat': 45, 'john_mulaney': 30, 'bill_maher': 30}}, False,
+     {'mo_gawdat': 43, 'john_mulaney': 29, 'bill_maher': 28}),
+]
+
+
+async def test_positioning_voice_blend():
+    """Positioning blends always sum to exactly 100."""
+
+    positioning_agent = PositioningAgent({})
+
+    print("Testing Positioning Voice Blend")
+    print("=" * 50)
+
+    for strategy, keywords, expected in POSITIONING_CASES:
+        blend = positioning_agent._calibrate_voice(strategy, {'keywords': keywords})
+        print(f"{keywords or strategy} -> {blend}")
+        assert blend == expected, (strategy, keywords, blend, expected)
+        assert sum(blend.values()) == 100, blend
+
+    print("\nAll positioning blend cases passed")
+
+
+async def test_content_voice_blend():
+    """Content blends always sum to exactly 100 without touching the source blend."""
+
+    content_agent = ContentAgent({})
+
+    print("Testing Content Voice Blend")
+    print("=" * 50)
+
+    for strategy, seeking_role, expected in CONTENT_CASES:
+        content_agent.narrative_facts = {'current_status': {'seeking_role': seeking_role}}
+        source = dict(strategy.get('voice_blend', {}))
+        blend = content_agent._determine_voice_blend(strategy, {})
+        print(f"{strategy or 'default'} (seeking={seeking_role}) -> {blend}")
+        assert blend == expected, (strategy, seeking_role, blend, expected)
+        assert sum(blend.values()) == 100, blend
+        assert strategy.get('voice_blend', {}) == source, "strategy blend was modified"
+
+    print("\nAll content blend cases passed")
+
+
+if __name__ == "__main__":
+    asyncio.run(test_positioning_voice_blend())
+    asyncio.run(test_content_voice_blend())
@@ -3,6 +3,7 @@
 
 from .narrative_store import NarrativeStore
 from .logging_setup import get_logger, log_kv, instrument
+from .voice_blend import normalize_voice_blend
 from .guardrails import (
     validate_claims,
     validate_ats_format,
@@ -14,6 +15,7 @@ __all__ = [
     'get_logger',
     'log_kv',
     'instrument',
+    'normalize_voice_blend',
     'validate_claims',
     'validate_ats_format',
     'validate_content'
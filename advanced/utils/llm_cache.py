@@ -0,0 +1,123 @@
+"""Response cache for LLM-generated content."""
+
+import hashlib
+import json
+import math
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from utils.logging_setup import get_logger
+
+logger = get_logger("llm_cache")
+
+
+def make_cache_key(payload: Any) -> str:
+    """Build a stable cache key from a JSON-serializable payload.
+
+    Args:
+        payload: Data identifying the request (dict keys are sorted)
+
+    Returns:
+        SHA-256 hex digest of the canonical JSON encoding
+    """
+    canonical = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def cosine_similarity(a: Sequence[float], b: Sequence[float]) -> float:
+    """Cosine similarity of two equal-length vectors (0.0 if either is zero)."""
+    dot = sum(x * y for x, y in zip(a, b))
+    norm_a = math.sqrt(sum(x * x for x in a))
+    norm_b = math.sqrt(sum(y * y for y in b))
+    if not norm_a or not norm_b:
+        return 0.0
+    return dot / (norm_a * norm_b)
+
+
+class LLMCache:
+    """Two-tier in-memory cache for LLM responses.
+
+    Exact hits are served by key. Entries stored with a scope and an
+    embedding can also be matched by cosine similarity, so a prompt that
+    differs only slightly from a previous one (same scope) reuses its
+    response. Entries are evicted least-recently-used; subclasses can
+    override ``get``/``set``/``get_similar`` to use an external store.
+    """
+
+    def __init__(self, max_entries: int = 256, similarity_threshold: float = 0.92):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of responses kept in memory
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+        """
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        self._entries: "OrderedDict[str, Tuple[str, Optional[str], Optional[List[float]]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached response for an exact key, if any."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    async def get_similar(self, scope: str, embedding: Sequence[float]) -> Optional[str]:
+        """Return the closest cached response within a scope above the threshold.
+
+        Args:
+            scope: Scope key the candidate entries must share
+            embedding: Embedding of the new prompt
+
+        Returns:
+            Cached response or None
+        """
+        best_key = None
+        best_score = self.similarity_threshold
+
+        for key, (_, entry_scope, entry_embedding) in self._entries.items():
+            if entry_scope != scope or not entry_embedding:
+                continue
+            score = cosine_similarity(embedding, entry_embedding)
+            if score >= best_score:
+                best_key, best_score = key, score
+
+        if best_key is None:
+            return None
+
+        logger.debug(f"Semantic cache hit (similarity {best_score:.3f})")
+        self._entries.move_to_end(best_key)
+        self.hits += 1
+        return self._entries[best_key][0]
+
+    async def set(self,
+                  key: str,
+                  value: str,
+                  scope: Optional[str] = None,
+                  embedding: Optional[Sequence[float]] = None) -> None:
+        """Store a response.
+
+        Args:
+            key: Exact cache key
+            value: Response text
+            scope: Optional scope for semantic matching
+            embedding: Optional embedding of the prompt
+        """
+        self._entries[key] = (value, scope, list(embedding) if embedding else None)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
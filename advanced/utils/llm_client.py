@@ -3,7 +3,7 @@
 import os
 import asyncio
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, AsyncIterator, Tuple
 from dotenv import load_dotenv
 import json
 
@@ -72,7 +72,8 @@ class LLMClient:
                               prompt: str,
                               system_prompt: str = None,
                               temperature: float = 0.7,
-                              max_tokens: int = 2000) -> str:
+                              max_tokens: int = 2000,
+                              cached_prefix: str = None) -> str:
         """Generate content using the configured LLM.
 
         Args:
@@ -80,6 +81,8 @@ class LLMClient:
             system_prompt: System instructions
             temperature: Creativity level (0-1)
             max_tokens: Maximum response length
+            cached_prefix: Context shared across calls, sent ahead of the
+                system prompt so the provider can reuse its prompt cache
 
         Returns:
             Generated text content
@@ -87,11 +90,11 @@ class LLMClient:
         try:
             if self.provider == 'openai' and self.openai_client:
                 return await self._generate_openai(
-                    prompt, system_prompt, temperature, max_tokens
+                    prompt, system_prompt, temperature, max_tokens, cached_prefix
                 )
             elif self.provider == 'anthropic' and self.anthropic_client:
                 return await self._generate_anthropic(
-                    prompt, system_prompt, temperature, max_tokens
+                    prompt, system_prompt, temperature, max_tokens, cached_prefix
                 )
             else:
                 logger.error(f"No LLM client available for provider: {self.provider}")
@@ -101,17 +104,100 @@ class LLMClient:
             logger.error(f"LLM generation failed: {e}")
             return self._generate_fallback(prompt)
 
+    async def generate_content_stream(self,
+                                      prompt: str,
+                                      system_prompt: str = None,
+                                      temperature: float = 0.7,
+                                      max_tokens: int = 2000,
+                                      cached_prefix: str = None) -> AsyncIterator[str]:
+        """Stream generated content as it arrives from the LLM.
+
+        Falls back to yielding the canned response in a single chunk when no
+        client is available or the request fails before any text arrives.
+        Failures after the first chunk are re-raised, since the caller has
+        already consumed part of the response.
+
+        Args:
+            prompt: User prompt
+            system_prompt: System instructions
+            temperature: Creativity level (0-1)
+            max_tokens: Maximum response length
+            cached_prefix: Context shared across calls (see generate_content)
+
+        Yields:
+            Text chunks in generation order
+        """
+        started = False
+        try:
+            if self.provider == 'openai' and self.openai_client:
+                stream = self._stream_openai(
+                    prompt, system_prompt, temperature, max_tokens, cached_prefix
+                )
+            elif self.provider == 'anthropic' and self.anthropic_client:
+                stream = self._stream_anthropic(
+                    prompt, system_prompt, temperature, max_tokens, cached_prefix
+                )
+            else:
+                logger.error(f"No LLM client available for provider: {self.provider}")
+                yield self._generate_fallback(prompt)
+                return
+
+            async for chunk in stream:
+                started = True
+                yield chunk
+
+        except Exception as e:
+            if started:
+                raise
+            logger.error(f"LLM generation failed: {e}")
+            yield self._generate_fallback(prompt)
+
+    async def _stream_openai(self,
+                             prompt: str,
+                             system_prompt: str,
+                             temperature: float,
+                             max_tokens: int,
+                             cached_prefix: str = None) -> AsyncIterator[str]:
+        """Stream content using OpenAI."""
+        messages = self._openai_messages(prompt, system_prompt, cached_prefix)
+
+        response = await self.openai_client.chat.completions.create(
+            model=self.openai_model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True
+        )
+
+        async for event in response:
+            if event.choices and event.choices[0].delta.content:
+                yield event.choices[0].delta.content
+
+    async def _stream_anthropic(self,
+                                prompt: str,
+                                system_prompt: str,
+                                temperature: float,
+                                max_tokens: int,
+                                cached_prefix: str = None) -> AsyncIterator[str]:
+        """Stream content using Anthropic."""
+        async with self.anthropic_client.messages.stream(
+            model=self.anthropic_model,
+            system=self._anthropic_system(system_prompt, cached_prefix),
+            messages=[{"role": "user", "content": prompt}],
+            temperature=temperature,
+            max_tokens=max_tokens
+        ) as stream:
+            async for text in stream.text_stream:
+                yield text
+
     async def _generate_openai(self,
                               prompt: str,
                               system_prompt: str,
                               temperature: float,
-                              max_tokens: int) -> str:
+                              max_tokens: int,
+                              cached_prefix: str = None) -> str:
         """Generate content using OpenAI."""
-        messages = []
-
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
+        messages = self._openai_messages(prompt, system_prompt, cached_prefix)
 
         response = await self.openai_client.chat.completions.create(
             model=self.openai_model,
@@ -126,13 +212,13 @@ class LLMClient:
                                  prompt: str,
                                  system_prompt: str,
                                  temperature: float,
-                                 max_tokens: int) -> str:
+                                 max_tokens: int,
+                                 cached_prefix: str = None) -> str:
         """Generate content using Anthropic."""
 
-        # Anthropic requires system prompt in create() call
         response = await self.anthropic_client.messages.create(
             model=self.anthropic_model,
-            system=system_prompt if system_prompt else "You are a helpful assistant.",
+            system=self._anthropic_system(system_prompt, cached_prefix),
             messages=[{"role": "user", "content": prompt}],
             temperature=temperature,
             max_tokens=max_tokens
@@ -140,6 +226,84 @@ class LLMClient:
 
         return response.content[0].text
 
+    @staticmethod
+    def _openai_messages(prompt: str,
+                         system_prompt: Optional[str],
+                         cached_prefix: Optional[str]) -> List[Dict[str, str]]:
+        """Build OpenAI chat messages with the shared prefix first.
+
+        OpenAI caches repeated prompt prefixes automatically, so the shared
+        context only has to come first and stay byte-identical.
+        """
+        messages = []
+
+        if cached_prefix:
+            messages.append({"role": "system", "content": cached_prefix})
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+
+        return messages
+
+    @staticmethod
+    def _anthropic_system(system_prompt: Optional[str],
+                          cached_prefix: Optional[str]) -> Any:
+        """Build the Anthropic system parameter, marking the shared prefix cacheable."""
+        system_prompt = system_prompt if system_prompt else "You are a helpful assistant."
+        if not cached_prefix:
+            return system_prompt
+
+        return [
+            {"type": "text", "text": cached_prefix, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": system_prompt}
+        ]
+
+    def _facts_prompt(self, facts: Dict[str, Any]) -> str:
+        """Render verified facts as the prompt prefix shared by resume and cover letter calls."""
+        return f"""VERIFIED FACTS ABOUT THE CANDIDATE (USE EXACTLY AS PROVIDED - NO HALLUCINATION):
+{json.dumps(facts, indent=2)[:3500]}"""
+
+    @property
+    def model_name(self) -> str:
+        """Name of the model serving the configured provider."""
+        if self.provider == 'openai':
+            return getattr(self, 'openai_model', 'unavailable')
+        if self.provider == 'anthropic':
+            return getattr(self, 'anthropic_model', 'unavailable')
+        return 'unavailable'
+
+    async def embed(self, text: str) -> Optional[List[float]]:
+        """Embed text for similarity lookups.
+
+        Only OpenAI exposes an embeddings endpoint; other providers return None.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding vector or None if unavailable
+        """
+        if not (self.provider == 'openai' and self.openai_client):
+            return None
+
+        try:
+            response = await self.openai_client.embeddings.create(
+                model=os.getenv('OPENAI_EMBEDDING_MODEL', 'text-embedding-3-small'),
+                input=text
+            )
+            return response.data[0].embedding
+        except Exception as e:
+            logger.warning(f"Embedding failed: {e}")
+            return None
+
+    def is_fallback(self, content: str) -> bool:
+        """Check whether content is one of the canned fallback responses."""
+        return content in (
+            self._get_fallback_resume(),
+            self._get_fallback_cover_letter(),
+            "Unable to generate content. Please check LLM configuration."
+        )
+
     def _generate_fallback(self, prompt: str) -> str:
         """Generate fallback content when LLM is unavailable."""
         logger.warning("Using fallback generation (no LLM available)")
@@ -231,6 +395,39 @@ Best regards,
         Returns:
             Generated resume content
         """
+        system_prompt, user_prompt = self._build_resume_prompts(job_data)
+        return await self.generate_content(
+            prompt=user_prompt,
+            system_prompt=system_prompt,
+            temperature=0.7,
+            max_tokens=2000,
+            cached_prefix=self._facts_prompt(facts)
+        )
+
+    def generate_resume_stream(self,
+                               job_data: Dict[str, Any],
+                               facts: Dict[str, Any],
+                               positioning: str,
+                               voice_blend: Dict[str, int]) -> AsyncIterator[str]:
+        """Stream a tailored resume chunk by chunk.
+
+        Same prompts as generate_resume().
+
+        Returns:
+            Async iterator over generated text chunks
+        """
+        system_prompt, user_prompt = self._build_resume_prompts(job_data)
+        return self.generate_content_stream(
+            prompt=user_prompt,
+            system_prompt=system_prompt,
+            temperature=0.7,
+            max_tokens=2000,
+            cached_prefix=self._facts_prompt(facts)
+        )
+
+    def _build_resume_prompts(self,
+                              job_data: Dict[str, Any]) -> Tuple[str, str]:
+        """Build the (system, user) prompt pair for resume generation."""
         system_prompt = f"""You are an expert resume writer optimizing for the Universal JD-to-Application Scoring Rubric (85+ score target).
 
 CRITICAL STRUCTURE - MUST SCORE 5/5 ON EACH RUBRIC CATEGORY:
@@ -313,9 +510,6 @@ JOB REQUIREMENTS TO ADDRESS:
 ROLE CATEGORIZATION:
 {self._categorize_role(job_data.get('role', ''), job_data.get('description', ''))}
 
-VERIFIED FACTS (USE EXACTLY AS PROVIDED):
-{json.dumps(facts, indent=2)[:3500]}
-
 RUBRIC OPTIMIZATION CHECKLIST:
 ✅ Role Alignment (15%): Mirror JD verbs exactly (own, drive, ship, optimize)
 ✅ Outcomes & Metrics (15%): Every bullet has numbers with context
@@ -343,12 +537,7 @@ FINAL CHECKLIST:
 ✓ NO meta-commentary
 ✓ ENDS with education - nothing after"""
 
-        return await self.generate_content(
-            prompt=user_prompt,
-            system_prompt=system_prompt,
-            temperature=0.7,
-            max_tokens=2000
-        )
+        return system_prompt, user_prompt
 
     async def generate_cover_letter(self,
                                    job_data: Dict[str, Any],
@@ -366,6 +555,39 @@ FINAL CHECKLIST:
         Returns:
             Generated cover letter content
         """
+        system_prompt, user_prompt = self._build_cover_letter_prompts(job_data)
+        return await self.generate_content(
+            prompt=user_prompt,
+            system_prompt=system_prompt,
+            temperature=0.8,
+            max_tokens=1500,
+            cached_prefix=self._facts_prompt(facts)
+        )
+
+    def generate_cover_letter_stream(self,
+                                     job_data: Dict[str, Any],
+                                     facts: Dict[str, Any],
+                                     positioning: Dict[str, Any],
+                                     voice_blend: Dict[str, int]) -> AsyncIterator[str]:
+        """Stream a tailored cover letter chunk by chunk.
+
+        Same prompts as generate_cover_letter().
+
+        Returns:
+            Async iterator over generated text chunks
+        """
+        system_prompt, user_prompt = self._build_cover_letter_prompts(job_data)
+        return self.generate_content_stream(
+            prompt=user_prompt,
+            system_prompt=system_prompt,
+            temperature=0.8,
+            max_tokens=1500,
+            cached_prefix=self._facts_prompt(facts)
+        )
+
+    def _build_cover_letter_prompts(self,
+                                    job_data: Dict[str, Any]) -> Tuple[str, str]:
+        """Build the (system, user) prompt pair for cover letter generation."""
         system_prompt = f"""You are an expert cover letter writer creating a DIRECT, CONCISE cover letter (300 words MAX, 4 paragraphs).
 
 CRITICAL: NO HALLUCINATION - Use ONLY verified facts from the provided JSON. NEVER make up companies, roles, or experiences.
@@ -412,9 +634,6 @@ Role: {job_data.get('role', 'Product Manager')}
 Key Job Requirements:
 {job_data.get('description', '')[:800]}
 
-Verified Facts (USE ONLY THESE - NO HALLUCINATION):
-{json.dumps(facts, indent=2)[:2500]}
-
 COMPANY-SPECIFIC HOOKS:
 {self._get_company_hooks(job_data.get('company', ''))}
 
@@ -441,12 +660,7 @@ ALWAYS end letter with:
 Best regards,
 [YOUR_NAME]"""
 
-        return await self.generate_content(
-            prompt=user_prompt,
-            system_prompt=system_prompt,
-            temperature=0.8,
-            max_tokens=1500
-        )
+        return system_prompt, user_prompt
 
     def _get_company_hooks(self, company: str) -> str:
         """Get company-specific hooks for cover letter."""
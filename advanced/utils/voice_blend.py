@@ -0,0 +1,31 @@
+"""Voice blend helpers shared by the positioning and content agents."""
+
+import heapq
+from typing import Dict
+
+
+def normalize_voice_blend(blend: Dict[str, int]) -> Dict[str, int]:
+    """Scale a voice blend to whole percentages that sum to exactly 100.
+
+    Uses the largest remainder method: every voice gets its truncated
+    share, then the leftover points go to the largest remainders, earlier
+    voices winning ties.
+
+    Args:
+        blend: Voice weights (not modified)
+
+    Returns:
+        New blend summing to 100, or a copy of the input if it already
+        does or has no weight at all
+    """
+    total = sum(blend.values())
+    if total == 100 or not total:
+        return dict(blend)
+
+    shares = {k: divmod(v * 100, total) for k, v in blend.items()}
+    normalized = {k: int(quotient) for k, (quotient, _) in shares.items()}
+    leftover = 100 - sum(normalized.values())
+    for k in heapq.nlargest(leftover, shares, key=lambda k: shares[k][1]):
+        normalized[k] += 1
+
+    return normalized